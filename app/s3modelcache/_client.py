@@ -0,0 +1,63 @@
+"""Shared, memoized S3 client construction.
+
+boto3's first client for a given configuration pays for the botocore data
+loader, endpoint resolution and the credential chain walk — hundreds of
+milliseconds that short-lived invocations (debug scripts, per-model loops)
+would otherwise repeat. One ``lru_cache``'d factory keeps a single client
+per distinct connection configuration for the lifetime of the process;
+boto3 clients are thread-safe, so sharing them is fine.
+"""
+from __future__ import annotations
+
+import functools
+import os
+from typing import Optional, Union
+
+import boto3
+
+
+@functools.lru_cache(maxsize=None)
+def get_s3_client(
+    endpoint: Optional[str],
+    access_key: Optional[str],
+    secret_key: Optional[str],
+    region: str = "us-east-1",
+    use_ssl: bool = True,
+    verify: Union[bool, str] = True,
+):
+    """Return a memoized S3 client for the given connection parameters.
+
+    ``verify`` is either a bool or the path to a CA bundle, exactly as
+    accepted by botocore. All arguments must stay hashable — they form the
+    cache key.
+    """
+    session = boto3.Session(
+        aws_access_key_id=access_key,
+        aws_secret_access_key=secret_key,
+        region_name=region,
+    )
+    return session.client(
+        "s3",
+        endpoint_url=endpoint,
+        use_ssl=use_ssl,
+        verify=verify,
+        config=boto3.session.Config(
+            signature_version="s3v4",
+            s3={
+                "addressing_style": "path",
+                # Skip hashing the full body into the v4 signature
+                # (UNSIGNED-PAYLOAD): SHA-256 over multi-GB parts is pure
+                # CPU on the upload hot path, and TLS already provides
+                # integrity in transit.
+                "payload_signing_enabled": False,
+            },
+            # The default pool of 10 connections starves the threaded
+            # upload/download paths; size it for the concurrency we
+            # actually use. S3MC_MAX_POOL overrides for unusual hosts.
+            max_pool_connections=int(os.environ.get("S3MC_MAX_POOL", "64")),
+            retries={"mode": "adaptive", "max_attempts": 10},
+            tcp_keepalive=True,
+            connect_timeout=10,
+            read_timeout=120,
+        ),
+    )
@@ -0,0 +1,102 @@
+"""Environment-based configuration for the caching entry points.
+
+Both ``cache_model.py`` entry points used to parse the same eight
+``HCP_*``/``S3_*`` environment variable pairs inline; this module centralizes
+the parsing so the scripts read the environment once and cannot drift apart.
+"""
+from __future__ import annotations
+
+import functools
+import os
+from dataclasses import dataclass
+from typing import Optional
+
+__all__ = ["S3CacheConfig", "load_config"]
+
+
+def _env(*names: str, default: Optional[str] = None) -> Optional[str]:
+    """Return the first non-empty value among *names*, else *default*."""
+    for name in names:
+        value = os.getenv(name)
+        if value:
+            return value
+    return default
+
+
+@dataclass(frozen=True, slots=True)
+class S3CacheConfig:
+    """Resolved S3/HCP connection settings, parsed once from the environment."""
+
+    model_id: Optional[str]
+    bucket: Optional[str]
+    endpoint: Optional[str]
+    access_key: Optional[str]
+    secret_key: Optional[str]
+    region: str
+    s3_prefix: str
+    verify_ssl: bool
+    root_ca_path: Optional[str]
+    store_as_archive: bool
+
+    @classmethod
+    def from_env(cls) -> "S3CacheConfig":
+        return cls(
+            model_id=os.getenv("MODEL_ID"),
+            bucket=_env("HCP_NAMESPACE", "S3_BUCKET"),
+            endpoint=_env("HCP_ENDPOINT", "S3_ENDPOINT"),
+            access_key=_env("HCP_ACCESS_KEY", "S3_ACCESS_KEY_ID"),
+            secret_key=_env("HCP_SECRET_KEY", "S3_SECRET_ACCESS_KEY"),
+            region=_env("HCP_REGION", "S3_REGION", default="us-east-1"),
+            s3_prefix=_env("HCP_PREFIX", "S3_PREFIX", default="models/"),
+            verify_ssl=_env(
+                "HCP_VERIFY_SSL", "S3_VERIFY_SSL", "VERIFY_SSL", default="true"
+            ).lower()
+            == "true",
+            root_ca_path=_env("HCP_ROOT_CA_PATH", "S3_ROOT_CA_PATH", "ROOT_CA_PATH"),
+            store_as_archive=_env(
+                "HCP_STORE_AS_ARCHIVE", "S3_STORE_AS_ARCHIVE", default="true"
+            ).lower()
+            == "true",
+        )
+
+    @property
+    def complete(self) -> bool:
+        """True when all mandatory connection settings are present."""
+        return bool(self.bucket and self.endpoint and self.access_key and self.secret_key)
+
+    @property
+    def use_ssl(self) -> bool:
+        # Derive SSL usage from endpoint scheme if possible
+        return not (self.endpoint or "").lower().startswith("http://")
+
+    @property
+    def verify(self):
+        """The ``verify`` argument for botocore: CA path, True or False."""
+        if self.root_ca_path and self.verify_ssl:
+            return self.root_ca_path
+        return self.verify_ssl
+
+    def kwargs(self) -> dict:
+        """Keyword arguments for constructing :class:`S3ModelCache`."""
+        return {
+            "bucket_name": self.bucket,
+            "s3_endpoint": self.endpoint,
+            "aws_access_key_id": self.access_key,
+            "aws_secret_access_key": self.secret_key,
+            "region_name": self.region,
+            "s3_prefix": self.s3_prefix,
+            "use_ssl": self.use_ssl,
+            "verify_ssl": self.verify_ssl,
+            "root_ca_path": self.root_ca_path,
+            "store_as_archive": self.store_as_archive,
+        }
+
+
+@functools.cache
+def load_config() -> S3CacheConfig:
+    """Parse the environment once per process and memoize the result.
+
+    Repeated calls within one process (e.g. ``extract_ca.py --test``
+    importing ``quick_s3_test``) skip the dozen getenv lookups.
+    """
+    return S3CacheConfig.from_env()
@@ -5,15 +5,41 @@ inline example at the bottom was removed to avoid side-effects on import.
 """
 from __future__ import annotations
 
+import functools
+import gzip
+import hashlib
+import io
 import logging
 import os
 import shutil
+import subprocess
+import sys
 import tarfile
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
-from typing import Optional
+from typing import ClassVar, Optional
 
-import boto3
+from boto3.s3.transfer import TransferConfig
 from botocore.exceptions import ClientError
+
+from ._client import get_s3_client
+
+try:
+    # hf_transfer (Rust, multiplexed connections) is dramatically faster than
+    # the pure-Python downloader on fat pipes. huggingface_hub reads these
+    # environment variables at import time, so they must be set before the
+    # import below. setdefault keeps an explicit user opt-out working.
+    import hf_transfer  # noqa: F401
+
+    os.environ.setdefault("HF_HUB_ENABLE_HF_TRANSFER", "1")
+    os.environ.setdefault("HF_XET_HIGH_PERFORMANCE", "1")
+    _HF_TRANSFER_AVAILABLE = True
+except ImportError:
+    _HF_TRANSFER_AVAILABLE = False
+
 from huggingface_hub import snapshot_download
 
 try:
@@ -21,8 +47,502 @@ try:
 except ImportError:
     LLM = None
 
-logging.basicConfig(level=logging.INFO)
+try:
+    # ISA-L's SIMD-accelerated DEFLATE is 3-5x faster than stdlib zlib while
+    # producing standard gzip output, so archives stay interchangeable.
+    from isal import igzip
+except ImportError:
+    igzip = None
+
+try:
+    import zstandard
+except ImportError:
+    zstandard = None
+
+try:
+    # Multithreaded gzip decoder: splits the deflate stream into chunks and
+    # decompresses them across cores, where igzip/zlib are single-threaded.
+    import rapidgzip
+except ImportError:
+    rapidgzip = None
+
+#: Archive formats supported by ``S3ModelCache(archive_format=...)``.
+ARCHIVE_FORMATS = ("tar", "tar.gz", "tar.zst")
+
+# Archives below this size go up as one plain PUT; larger ones hand off to
+# the multipart TransferConfig (matches its multipart_threshold).
+_SINGLE_PUT_MAX = 64 * 1024 * 1024
+
+# Files above this size get a progress log line when archived/extracted.
+_LARGE_FILE_LOG_THRESHOLD = 100 * 1024 * 1024
+
+
+class _LoggingTarFile(tarfile.TarFile):
+    """TarFile that logs members over 100 MB as they are extracted.
+
+    Keeps the progress logging of the old per-member extract loop while
+    letting ``extractall`` run the batch extraction path.
+    """
+
+    def _extract_member(self, tarinfo, targetpath, **kwargs):
+        if tarinfo.size > _LARGE_FILE_LOG_THRESHOLD and logger.isEnabledFor(logging.INFO):
+            logger.info("Extracting large file: %s (%.1f MB)",
+                      tarinfo.name, tarinfo.size / (1024 * 1024))
+        return super()._extract_member(tarinfo, targetpath, **kwargs)
+
+    def makefile(self, tarinfo, targetpath):
+        # For uncompressed archives read straight from disk, copy member
+        # bytes kernel-to-kernel with copy_file_range instead of bouncing
+        # them through Python buffers. The raw-FileIO check matters: a
+        # BufferedReader over a decompressor also answers fileno(), but
+        # with the *compressed* file's descriptor.
+        src = self.fileobj
+        if (
+            hasattr(os, "copy_file_range")
+            and tarinfo.sparse is None
+            and isinstance(src, io.BufferedReader)
+            and isinstance(src.raw, io.FileIO)
+        ):
+            try:
+                with open(targetpath, "wb") as dst:
+                    remaining = tarinfo.size
+                    offset = tarinfo.offset_data
+                    while remaining:
+                        copied = os.copy_file_range(
+                            src.raw.fileno(),
+                            dst.fileno(),
+                            min(remaining, 1 << 24),
+                            offset_src=offset,
+                        )
+                        if copied == 0:
+                            raise OSError("copy_file_range copied nothing")
+                        offset += copied
+                        remaining -= copied
+                return
+            except OSError:
+                # e.g. cross-device target; rebuild via the stdlib path.
+                pass
+        return super().makefile(tarinfo, targetpath)
+
+
+def _readahead(path: str) -> None:
+    """Ask the kernel to start reading *path* into the page cache.
+
+    POSIX_FADV_WILLNEED queues asynchronous readahead, so by the time the
+    tar loop reaches the file its data is (partly) cached and the gzip
+    worker is never starved waiting on a cold read. Purely a hint; errors
+    are ignored.
+    """
+    try:
+        fd = os.open(path, os.O_RDONLY)
+        try:
+            os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_WILLNEED)
+        finally:
+            os.close(fd)
+    except OSError:
+        pass
+
+
+def _advise_sequential(fileobj) -> None:
+    """Hint sequential access on *fileobj* (no-op where unsupported).
+
+    Lets the kernel double its readahead window for the archive scan
+    instead of ramping up from the default.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        os.posix_fadvise(fileobj.fileno(), 0, 0, os.POSIX_FADV_SEQUENTIAL)
+    except (OSError, ValueError, io.UnsupportedOperation):
+        pass
+
+
+def _advise_dontneed(path) -> None:
+    """Drop *path*'s clean pages from the page cache (no-op where unsupported).
+
+    A multi-GB archive read or written exactly once would otherwise evict
+    hot pages (model weights, build caches) it will never repay.
+    """
+    if not hasattr(os, "posix_fadvise"):
+        return
+    try:
+        fd = os.open(path, os.O_RDONLY)
+    except OSError:
+        return
+    try:
+        os.posix_fadvise(fd, 0, 0, os.POSIX_FADV_DONTNEED)
+    finally:
+        os.close(fd)
+
+
+def _readahead_enabled() -> bool:
+    """True when opt-in page-cache readahead should run (Linux only)."""
+    return (
+        sys.platform == "linux"
+        and bool(os.environ.get("S3MODELCACHE_READAHEAD"))
+        and hasattr(os, "posix_fadvise")
+    )
+
+
+def _iter_files(root: Path):
+    """Yield ``(abs_path, size, rel_posix)`` for every file under *root*.
+
+    Walks with ``os.scandir`` so the DirEntry's cached stat is reused; the
+    ``Path.rglob`` + ``is_file()`` + ``stat()`` combination issues two extra
+    ``stat(2)`` calls per entry, which adds up on snapshots with thousands of
+    files.
+    """
+    root_str = str(root)
+    stack = [root_str]
+    while stack:
+        with os.scandir(stack.pop()) as entries:
+            for entry in entries:
+                if entry.is_dir(follow_symlinks=False):
+                    stack.append(entry.path)
+                elif entry.is_file(follow_symlinks=False):
+                    rel = os.path.relpath(entry.path, root_str).replace(os.sep, "/")
+                    yield entry.path, entry.stat(follow_symlinks=False).st_size, rel
+
+
+# File types whose bytes are already entropy-dense; gzip gains <5% on them.
+_DENSE_SUFFIXES = (".safetensors", ".bin", ".gguf", ".pt")
+
+
+def _mostly_precompressed(root: Path) -> bool:
+    """True when >=90% of the bytes under *root* are in dense weight files."""
+    dense = total = 0
+    for _, size, rel in _iter_files(root):
+        total += size
+        if rel.endswith(_DENSE_SUFFIXES):
+            dense += size
+    return total > 0 and dense >= total * 0.9
+
+
+def _rmtree_fast(path: Path) -> None:
+    """Remove *path* recursively, preferring the external ``rm -rf``.
+
+    ``shutil.rmtree`` pays one Python-level walk iteration and ``unlink``
+    call per file — slow on snapshots with thousands of shards. The
+    external ``rm`` unlinks in C for one fork+exec; errors fall back to
+    the stdlib path.
+    """
+    if os.name == "posix" and shutil.which("rm"):
+        try:
+            if subprocess.run(["rm", "-rf", str(path)]).returncode == 0:
+                return
+        except OSError:
+            pass
+    shutil.rmtree(path, ignore_errors=True)
+
+
+@functools.lru_cache(maxsize=4096)
+def _s3_key_for(prefix: str, model_id: str, suffix: str) -> str:
+    """Memoized S3 key derivation; pure function of its arguments."""
+    return f"{prefix}{model_id.replace('/', '_')}{suffix}"
+
+
+@functools.lru_cache(maxsize=4096)
+def _local_path_for(cache_dir: str, model_id: str) -> Path:
+    """Memoized local path derivation.
+
+    Bulk operations derive the same key/path per model several times per
+    call (probe, transfer, cache bookkeeping); memoizing skips the repeated
+    string mangling and Path allocation.
+    """
+    return Path(cache_dir) / model_id.replace("/", "_")
+
+
+def _manifest_digest(root: Path) -> str:
+    """sha256 over the file manifest (relative path, size, mtime) of *root*.
+
+    Stat-only, so it costs milliseconds even for multi-GB snapshots; two
+    directories with identical manifests are treated as identical content,
+    which holds for snapshot downloads (files are written once).
+    """
+    hasher = hashlib.sha256()
+    for abs_path, size, rel in sorted(_iter_files(root), key=lambda e: e[2]):
+        mtime = int(os.stat(abs_path).st_mtime)
+        hasher.update(f"{rel}:{size}:{mtime}\n".encode())
+    return hasher.hexdigest()
+
+
+class _HashingWriter(io.RawIOBase):
+    """Pass-through writer that sha256-hashes everything written.
+
+    Hashing inline with the single streaming pass costs only the digest
+    update; hashing afterwards would mean reading the whole archive back.
+    """
+
+    def __init__(self, sink) -> None:
+        super().__init__()
+        self._sink = sink
+        self.digest = hashlib.sha256()
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self.digest.update(b)
+        return self._sink.write(b)
+
+
+class _RollingPrefetchReader(io.RawIOBase):
+    """Forward-only reader over an S3 object with overlapped ranged GETs.
+
+    While the consumer (tar extraction) chews on the current block, the next
+    few 16 MiB ranges are already in flight on a small thread pool, so the
+    network never sits idle waiting for the extractor and vice versa. The
+    read-side mirror of :class:`_S3MultipartWriter`.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket: str,
+        key: str,
+        *,
+        block_size: int = 16 * 1024 * 1024,
+        max_workers: int = 8,
+    ):
+        super().__init__()
+        self._s3 = s3_client
+        self._bucket = bucket
+        self._key = key
+        self._block_size = block_size
+        # The first ranged GET doubles as the existence probe — a missing
+        # key raises here, before any pool is spun up.
+        first = s3_client.get_object(
+            Bucket=bucket, Key=key, Range=f"bytes=0-{block_size - 1}"
+        )
+        content_range = first.get("ContentRange")
+        if content_range:
+            self._size = int(content_range.rsplit("/", 1)[1])
+            self._next_offset = min(block_size, self._size)
+        else:
+            # Server ignored the Range header and returned the full body;
+            # the first future already covers the whole object, so no
+            # further ranges may be scheduled.
+            self._size = first["ContentLength"]
+            self._next_offset = self._size
+        self._pool = ThreadPoolExecutor(max_workers=max_workers)
+        self._pending: deque = deque()
+        self._pending.append(self._pool.submit(first["Body"].read))
+        self._buffer = memoryview(b"")
+        for _ in range(max_workers - 1):
+            self._submit_next()
+
+    def _submit_next(self) -> None:
+        if self._next_offset >= self._size:
+            return
+        start = self._next_offset
+        end = min(start + self._block_size, self._size) - 1
+        self._next_offset = end + 1
+
+        def fetch() -> bytes:
+            resp = self._s3.get_object(
+                Bucket=self._bucket, Key=self._key, Range=f"bytes={start}-{end}"
+            )
+            return resp["Body"].read()
+
+        self._pending.append(self._pool.submit(fetch))
+
+    def readable(self) -> bool:
+        return True
+
+    def readinto(self, b) -> int:
+        if not self._buffer:
+            if not self._pending:
+                return 0
+            self._buffer = memoryview(self._pending.popleft().result())
+            self._submit_next()
+        n = min(len(b), len(self._buffer))
+        b[:n] = self._buffer[:n]
+        self._buffer = self._buffer[n:]
+        return n
+
+    def close(self) -> None:
+        if not self.closed:
+            self._pool.shutdown(wait=False, cancel_futures=True)
+        super().close()
+
+
+class _S3MultipartWriter(io.RawIOBase):
+    """Write-only file object that streams into an S3 multipart upload.
+
+    Bytes written are buffered until a full part is available, then uploaded
+    on a small thread pool so compression overlaps the network PUTs. Used as
+    the ``fileobj`` sink of a streaming tarfile, which lets
+    ``cache_model_to_s3`` upload an archive without ever writing it to disk.
+    """
+
+    def __init__(
+        self,
+        s3_client,
+        bucket: str,
+        key: str,
+        *,
+        part_size: int = 64 * 1024 * 1024,
+        max_workers: int = 8,
+        if_none_match: bool = False,
+    ) -> None:
+        super().__init__()
+        self._client = s3_client
+        self._bucket = bucket
+        self._key = key
+        # When set, completion carries If-None-Match: * so a concurrent
+        # writer racing us on the same key loses cleanly instead of
+        # overwriting (last-writer-wins).
+        self._if_none_match = if_none_match
+        self._part_size = part_size
+        self._buffer = bytearray()
+        self._part_number = 1
+        self._futures: list = []
+        # True once the upload has been completed or aborted on the server;
+        # tracked separately from ``closed`` so a failed close() can still
+        # be (or already has been) aborted instead of leaving billed parts.
+        self._settled = False
+        self._executor = ThreadPoolExecutor(max_workers=max_workers)
+        # Backpressure: the producer (a streaming tar, often at compression
+        # level 0) can outrun any network link, and the executor's queue is
+        # unbounded. Cap in-flight parts so write() blocks instead of
+        # buffering the not-yet-uploaded tail of the archive in RAM.
+        self._in_flight = threading.Semaphore(max_workers + 2)
+        self._upload_id = s3_client.create_multipart_upload(Bucket=bucket, Key=key)[
+            "UploadId"
+        ]
+
+    def writable(self) -> bool:
+        return True
+
+    def write(self, b) -> int:
+        self._buffer.extend(b)
+        while len(self._buffer) >= self._part_size:
+            chunk = bytes(self._buffer[: self._part_size])
+            del self._buffer[: self._part_size]
+            self._submit_part(chunk)
+        return len(b)
+
+    def _submit_part(self, chunk: bytes) -> None:
+        self._in_flight.acquire()
+        # While blocked above a part may have failed; re-raising here stops
+        # the producer right away instead of only at close().
+        for future in self._futures:
+            if future.done() and future.exception() is not None:
+                raise future.exception()
+        part_number = self._part_number
+        self._part_number += 1
+        self._futures.append(self._executor.submit(self._upload_part, part_number, chunk))
+
+    def _upload_part(self, part_number: int, chunk: bytes) -> dict:
+        try:
+            resp = self._client.upload_part(
+                Bucket=self._bucket,
+                Key=self._key,
+                UploadId=self._upload_id,
+                PartNumber=part_number,
+                Body=chunk,
+            )
+        finally:
+            self._in_flight.release()
+        return {"PartNumber": part_number, "ETag": resp["ETag"]}
+
+    def close(self) -> None:
+        if self.closed:
+            return
+        try:
+            # S3 requires at least one part, so flush even an empty tail.
+            if self._buffer or self._part_number == 1:
+                self._submit_part(bytes(self._buffer))
+                self._buffer.clear()
+            parts = sorted(
+                (f.result() for f in self._futures), key=lambda p: p["PartNumber"]
+            )
+            self._complete({"Parts": parts})
+        except BaseException:
+            # A failed part or completion leaves the upload open on the
+            # server; abort here rather than relying on the caller, whose
+            # abort() would otherwise find the file already closed.
+            self._abort_upload()
+            raise
+        finally:
+            self._executor.shutdown(wait=True)
+            super().close()
+
+    def _complete(self, multipart_upload: dict) -> None:
+        kwargs = {"IfNoneMatch": "*"} if self._if_none_match else {}
+        try:
+            self._client.complete_multipart_upload(
+                Bucket=self._bucket,
+                Key=self._key,
+                UploadId=self._upload_id,
+                MultipartUpload=multipart_upload,
+                **kwargs,
+            )
+        except ClientError as exc:
+            code = exc.response.get("Error", {}).get("Code", "")
+            if kwargs and code == "NotImplemented":
+                # Store doesn't honour conditional completion; complete
+                # unconditionally, which restores last-writer-wins.
+                self._client.complete_multipart_upload(
+                    Bucket=self._bucket,
+                    Key=self._key,
+                    UploadId=self._upload_id,
+                    MultipartUpload=multipart_upload,
+                )
+            elif kwargs and code == "PreconditionFailed":
+                # A concurrent writer created the key first; the archive is
+                # content-identical, so drop our parts and count it done.
+                logger.info("Key %s was created concurrently; discarding upload", self._key)
+                self._client.abort_multipart_upload(
+                    Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+                )
+            else:
+                raise
+        self._settled = True
+
+    def _abort_upload(self) -> None:
+        if self._settled:
+            return
+        self._settled = True
+        try:
+            self._client.abort_multipart_upload(
+                Bucket=self._bucket, Key=self._key, UploadId=self._upload_id
+            )
+        except ClientError as exc:
+            logger.warning("Aborting multipart upload failed: %s", exc)
+
+    def abort(self) -> None:
+        """Abort the multipart upload, discarding any uploaded parts.
+
+        Safe to call after a failed ``close()`` — only the first of the two
+        actually issues the server-side abort.
+        """
+        self._executor.shutdown(wait=True, cancel_futures=True)
+        self._abort_upload()
+        io.RawIOBase.close(self)
+
+# Configure only this package's logger instead of calling basicConfig here:
+# basicConfig is a no-op once any handler is installed (HCPLogger calls it
+# too), and mutating the root logger from a library surprises embedders.
 logger = logging.getLogger(__name__)
+logger.setLevel(logging.INFO)
+
+# tarfile (and shutil.copyfileobj) copy member data in 16-64 KiB chunks by
+# default, which is pure syscall and GIL-bounce overhead on multi-GB weight
+# shards. 8 MiB amortizes both while staying cheap on memory — one buffer per
+# active stream.
+_COPY_BUFSIZE = 8 * 1024 * 1024
+# Buffer size for the underlying archive file object, so small tar record
+# writes/reads are coalesced into large sequential I/O.
+_FILE_BUFSIZE = 8 * 1024 * 1024
+# Blocking factor for the "w|"/"r|" stream modes. tarfile's default is the
+# historical 10 KiB record; 1 MiB means far fewer write(2)/read(2) calls per
+# archive (the end-of-archive padding it implies compresses to nothing).
+_STREAM_BUFSIZE = 1024 * 1024
+# How long a positive head_object/list result is trusted before the next
+# real round-trip. Short on purpose: it only needs to absorb repeated checks
+# within one batch run.
+_HEAD_CACHE_TTL = 60.0
 
 
 class S3ModelCache:
@@ -39,6 +559,13 @@ class S3ModelCache:
     You can also pass ``root_ca_path`` to specify a custom root CA bundle for
     HTTPS connections to your S3 endpoint (e.g. when using self-signed certs).
     """
+
+    # (endpoint, bucket) pairs whose head_bucket probe already succeeded in
+    # this process. Shared across instances so short-lived scripts that
+    # construct several caches against the same bucket pay the round-trip
+    # only once.
+    _verified_buckets: ClassVar[set[tuple[str, str]]] = set()
+
     def __init__(
         self,
         bucket_name: str,
@@ -48,18 +575,67 @@ class S3ModelCache:
         region_name: str = "us-east-1",
         local_cache_dir: Optional[str] = None,
         s3_prefix: str = "models/",
+        mirror_prefix: Optional[str] = None,
         use_ssl: bool = True,
         verify_ssl: bool = True,
         root_ca_path: Optional[str] = None,
         store_as_archive: bool = True,
+        archive_format: str = "tar.gz",
+        compression_level: int = 1,
+        max_upload_concurrency: int = 16,
+        hf_transfer: bool = True,
+        key_style: str = "plain",
     ) -> None:
         self.bucket_name = bucket_name
         self.s3_endpoint = s3_endpoint
         self.s3_prefix = s3_prefix.rstrip("/") + "/"
+        # "plain" keeps the readable models/<id>.tar.gz scheme; "hash" keys
+        # archives by a truncated sha256 of the model id, which cannot
+        # collide across namespaces that flatten to the same string.
+        if key_style not in ("plain", "hash"):
+            raise ValueError("key_style must be 'plain' or 'hash'")
+        self.key_style = key_style
+        # Opt-in double-write: after a successful archive upload the object
+        # is server-side copied under this prefix as well, and reads fall
+        # back to it. Masks read-after-write visibility lag on eventually
+        # consistent S3-compatible stores (HCP, Ceph).
+        self.mirror_prefix = mirror_prefix.rstrip("/") + "/" if mirror_prefix else None
         # If True (default), models are stored as a single tar.gz archive in S3.
         # If False, the model directory is stored as individual files under a
         # model-specific prefix.
         self.store_as_archive = store_as_archive
+        # Archive container format. "tar" skips compression entirely (model
+        # weights are near-incompressible, so gzip mostly burns CPU),
+        # "tar.zst" uses multi-threaded zstd via the optional `zstandard`
+        # package, "tar.gz" keeps the backwards-compatible default.
+        if archive_format not in ARCHIVE_FORMATS:
+            raise ValueError(f"archive_format must be one of {ARCHIVE_FORMATS}")
+        if archive_format == "tar.zst" and zstandard is None:
+            raise ValueError("archive_format='tar.zst' requires the 'zstandard' package")
+        self.archive_format = archive_format
+        self._archive_suffix = f".{archive_format}"
+        # Level 1 by default: model weights are near-incompressible, so
+        # higher levels burn CPU for single-digit percent ratio gains.
+        self.compression_level = compression_level
+        # Number of files uploaded/downloaded concurrently in directory mode.
+        self.max_upload_concurrency = max_upload_concurrency
+        # Opt-out for the accelerated HuggingFace downloader. The flag is
+        # process-wide because huggingface_hub resolves it once at import.
+        if not hf_transfer and _HF_TRANSFER_AVAILABLE:
+            os.environ["HF_HUB_ENABLE_HF_TRANSFER"] = "0"
+            import huggingface_hub.constants
+
+            huggingface_hub.constants.HF_HUB_ENABLE_HF_TRANSFER = False
+        self.hf_transfer = hf_transfer and _HF_TRANSFER_AVAILABLE
+        # Per-file transfer tuning for directory mode: large shards still go
+        # multipart, but with moderate per-file concurrency since many files
+        # are already in flight at once.
+        self._dir_transfer_config = TransferConfig(
+            multipart_threshold=64 * 1024 * 1024,
+            multipart_chunksize=32 * 1024 * 1024,
+            max_concurrency=8,
+            use_threads=True,
+        )
         # Resolve the local cache directory with the following precedence:
         #   1. Explicit `local_cache_dir` argument
         #   2. Environment variable `MODEL_CACHE_DIR`
@@ -68,42 +644,112 @@ class S3ModelCache:
         self.local_cache_dir = Path(_cache_dir)
         self.local_cache_dir.mkdir(exist_ok=True)
 
-        session = boto3.Session(
-            aws_access_key_id=aws_access_key_id,
-            aws_secret_access_key=aws_secret_access_key,
-            region_name=region_name,
-        )
         # If a custom root CA bundle is provided, use it for SSL verification
         _verify_param = root_ca_path if root_ca_path else verify_ssl
 
-        self.s3_client = session.client(
-            "s3",
-            endpoint_url=s3_endpoint,
+        # Clients are memoized per connection configuration (see _client),
+        # so repeated constructions skip botocore's loader/credential walk.
+        self.s3_client = get_s3_client(
+            s3_endpoint,
+            aws_access_key_id,
+            aws_secret_access_key,
+            region=region_name,
             use_ssl=use_ssl,
             verify=_verify_param,
-            config=boto3.session.Config(
-                signature_version="s3v4",
-                s3={"addressing_style": "path"},
-            ),
         )
+        # Shared transfer tuning for single-archive uploads and downloads.
+        # Sized for multi-GB tar archives: big parts keep the per-part
+        # overhead low, 32 workers saturate the pipe (the client Config's
+        # max_pool_connections is sized to match). S3MC_CONC overrides the
+        # worker count for hosts where 32 is the wrong fit.
+        _transfer_conc = int(os.environ.get("S3MC_CONC", "32"))
+        self._transfer_config = TransferConfig(
+            multipart_threshold=64 * 1024 * 1024,
+            multipart_chunksize=64 * 1024 * 1024,
+            max_concurrency=_transfer_conc,
+            use_threads=True,
+            io_chunksize=4 * 1024 * 1024,
+            # Deep writeback queue so download threads never stall waiting
+            # for the single disk-writer to drain.
+            max_io_queue=1000,
+        )
+        # Download-side tuning differs from upload: ranged GETs peak with
+        # 8-16 MiB parts, so a low threshold and smaller chunks fan a single
+        # archive out across all 32 workers much earlier than the 64 MiB
+        # upload parts would.
+        self._download_transfer_config = TransferConfig(
+            multipart_threshold=8 * 1024 * 1024,
+            multipart_chunksize=16 * 1024 * 1024,
+            max_concurrency=_transfer_conc,
+            use_threads=True,
+            io_chunksize=4 * 1024 * 1024,
+            max_io_queue=1000,
+        )
+
+        # Positive existence results keyed by S3 key/prefix, value is the
+        # monotonic timestamp of the check (see _HEAD_CACHE_TTL).
+        self._head_cache: dict[str, float] = {}
+        # Full key inventory under s3_prefix, built as a side effect of the
+        # shallow listing in ``list_cached_models``. None = not built yet.
+        self._s3_inventory: Optional[set[str]] = None
+        # Bucket reachability is probed lazily on the first real S3
+        # operation, so constructing a cache (e.g. for purely local work)
+        # costs no network round-trip.
+        self._bucket_verified = False
 
+    # ───────────────────────────── Internal helpers ────────────────────────────
+    def _ensure_bucket(self) -> None:
+        """Verify bucket reachability once, on the first S3 operation."""
+        if self._bucket_verified:
+            return
+        probe = (self.s3_endpoint, self.bucket_name)
+        if probe in S3ModelCache._verified_buckets:
+            self._bucket_verified = True
+            return
         try:
-            self.s3_client.head_bucket(Bucket=bucket_name)
-            logger.info("S3 bucket '%s' reachable", bucket_name)
+            self.s3_client.head_bucket(Bucket=self.bucket_name)
+            logger.info("S3 bucket '%s' reachable", self.bucket_name)
         except ClientError as exc:
             logger.error("Bucket access failed: %s", exc)
             raise
+        S3ModelCache._verified_buckets.add(probe)
+        self._bucket_verified = True
 
-    # ───────────────────────────── Internal helpers ────────────────────────────
     def _get_s3_key(self, model_id: str) -> str:
-        """Return the S3 key for a model archive (tar.gz).
+        """Return the S3 key for a model archive.
 
-        This is only used when ``store_as_archive`` is True.
+        This is only used when ``store_as_archive`` is True; the suffix
+        follows the configured ``archive_format``. With ``key_style="hash"``
+        the id is replaced by a truncated sha256, sidestepping collisions
+        between ids like ``a/b_c`` and ``a_b/c`` that flatten identically.
         """
-        return f"{self.s3_prefix}{model_id.replace('/', '_')}.tar.gz"
+        if self.key_style == "hash":
+            digest = hashlib.sha256(model_id.encode("utf-8")).hexdigest()[:16]
+            return f"{self.s3_prefix}{digest}{self._archive_suffix}"
+        return _s3_key_for(self.s3_prefix, model_id, self._archive_suffix)
+
+    def _mirror_key(self, s3_key: str) -> Optional[str]:
+        """Return the replica key for *s3_key*, or None when mirroring is off."""
+        if self.mirror_prefix is None:
+            return None
+        return self.mirror_prefix + s3_key.removeprefix(self.s3_prefix)
+
+    def _mirror_object(self, s3_key: str) -> None:
+        """Server-side copy *s3_key* under the mirror prefix (best effort)."""
+        mirror = self._mirror_key(s3_key)
+        if mirror is None:
+            return
+        try:
+            self.s3_client.copy_object(
+                Bucket=self.bucket_name,
+                CopySource={"Bucket": self.bucket_name, "Key": s3_key},
+                Key=mirror,
+            )
+        except ClientError as exc:
+            logger.warning("Mirror copy to %s failed: %s", mirror, exc)
 
     def _get_local_path(self, model_id: str) -> Path:
-        return self.local_cache_dir / model_id.replace("/", "_")
+        return _local_path_for(str(self.local_cache_dir), model_id)
 
     def _get_s3_prefix_for_dir(self, model_id: str) -> str:
         """Return the S3 prefix used to store a model as a directory.
@@ -113,28 +759,425 @@ class S3ModelCache:
         """
         return f"{self.s3_prefix}{model_id.replace('/', '_')}/"
 
+    def _effective_level(self, model_path: Path) -> int:
+        """Compression level to use for *model_path*.
+
+        Weight-only snapshots (safetensors/bin/gguf/pt dominating the byte
+        count) are entropy-dense: gzip burns a core per stream for a <5%
+        ratio. Dropping to level 0 keeps the .tar.gz container — and thus
+        the key scheme and the whole load path — while turning compression
+        into a near-memcpy.
+        """
+        if self.compression_level and _mostly_precompressed(model_path):
+            logger.info(
+                "%s is mostly pre-compressed weights; storing without compression",
+                model_path.name,
+            )
+            return 0
+        return self.compression_level
+
     def _compress_model(self, model_path: Path, archive_path: Path) -> None:
         """Compress model directory to tar.gz with memory-efficient streaming.
-        
-        This method processes files one by one to avoid loading large models
-        entirely into memory, preventing crashes with multi-GB models.
+
+        When ``tar`` and ``pigz`` are available on PATH, compression is
+        delegated to an external ``tar | pigz`` pipeline so gzip runs in
+        parallel across all cores instead of single-threaded through Python's
+        zlib. Otherwise this falls back to the pure-Python tarfile path, which
+        processes files one by one to avoid loading large models entirely into
+        memory.
         """
         logger.info("Compressing %s -> %s", model_path, archive_path)
-        
-        with tarfile.open(archive_path, "w:gz") as tar:
-            # Add files one by one to control memory usage
-            for file_path in model_path.rglob("*"):
-                if file_path.is_file():
-                    # Calculate the archive name (relative path within the model)
-                    arcname = model_path.name / file_path.relative_to(model_path)
-                    
-                    # Add file with streaming to avoid loading entire file into memory
-                    tar.add(file_path, arcname=str(arcname))
-                    
-                    # Log progress for large operations
-                    if file_path.stat().st_size > 100 * 1024 * 1024:  # > 100MB
-                        logger.info("Added large file: %s (%.1f MB)", 
-                                  file_path.name, file_path.stat().st_size / (1024*1024))
+
+        level = self._effective_level(model_path)
+        if (
+            self.archive_format == "tar.gz"
+            and shutil.which("tar")
+            and shutil.which("pigz")
+        ):
+            self._compress_model_external(model_path, archive_path, level)
+        else:
+            self._compress_model_tarfile(model_path, archive_path, level)
+
+    def _compress_model_external(
+        self, model_path: Path, archive_path: Path, level: int
+    ) -> None:
+        """Compress via ``tar -cf - | pigz`` for multi-core gzip throughput.
+
+        The level follows ``compression_level`` (default 1): model weights are
+        essentially incompressible, so higher levels buy almost nothing.
+        """
+        with open(archive_path, "wb") as out:
+            tar_proc = subprocess.Popen(
+                ["tar", "-C", str(model_path.parent), "-cf", "-", model_path.name],
+                stdout=subprocess.PIPE,
+            )
+            pigz_proc = subprocess.Popen(
+                ["pigz", "-p", str(os.cpu_count() or 1), f"-{level}"],
+                stdin=tar_proc.stdout,
+                stdout=out,
+            )
+            # Allow tar to receive SIGPIPE if pigz exits early.
+            tar_proc.stdout.close()
+            pigz_rc = pigz_proc.wait()
+            tar_rc = tar_proc.wait()
+        if tar_rc or pigz_rc:
+            archive_path.unlink(missing_ok=True)
+            raise RuntimeError(
+                f"External compression pipeline failed (tar={tar_rc}, pigz={pigz_rc})"
+            )
+
+    def _open_archive_for_write(self, archive_path: Path, level: Optional[int] = None):
+        """Return ``(fileobj, tarfile mode)`` for the configured archive format."""
+        if level is None:
+            level = self.compression_level
+        if self.archive_format == "tar":
+            return open(archive_path, "wb", buffering=_FILE_BUFSIZE), "w"
+        if self.archive_format == "tar.zst":
+            raw = open(archive_path, "wb", buffering=_FILE_BUFSIZE)
+            # zstd has no stored mode; level 1 already skips incompressible
+            # blocks cheaply.
+            cctx = zstandard.ZstdCompressor(level=max(level, 1), threads=-1)
+            return cctx.stream_writer(raw), "w|"
+        # tar.gz
+        if igzip is not None:
+            # Write an uncompressed tar stream into an igzip file object.
+            # ISA-L only implements levels 0-3, so clamp the knob.
+            return igzip.open(
+                archive_path, "wb", compresslevel=min(level, 3)
+            ), "w|"
+        # mtime=0 keeps the gzip header free of the build timestamp, so the
+        # same snapshot always produces byte-identical archives (and thus
+        # stable digests/ETags).
+        return gzip.GzipFile(
+            str(archive_path), "wb", compresslevel=level, mtime=0
+        ), "w|"
+
+    def _open_archive_for_read(self, archive_path: Path):
+        """Return ``(fileobj, tarfile mode)`` mirroring :meth:`_open_archive_for_write`.
+
+        Decompressed streams are re-buffered in 8 MiB blocks before tarfile
+        sees them: handing tarfile a plain BufferedReader in "r|" mode keeps
+        member reads out of ``_Stream``'s per-chunk slice-and-join buffering
+        (bpo-34043), which costs measurable CPU on multi-GB archives.
+        """
+        if self.archive_format == "tar":
+            raw = open(archive_path, "rb", buffering=_FILE_BUFSIZE)
+            _advise_sequential(raw)
+            return raw, "r"
+        if self.archive_format == "tar.zst":
+            raw = open(archive_path, "rb", buffering=_FILE_BUFSIZE)
+            _advise_sequential(raw)
+            decomp = zstandard.ZstdDecompressor().stream_reader(raw)
+            return io.BufferedReader(decomp, buffer_size=_FILE_BUFSIZE), "r|"
+        if rapidgzip is not None:
+            # Parallel decompression across all cores; the file handle is
+            # owned (and closed) by the rapidgzip reader.
+            gz = rapidgzip.RapidgzipFile(
+                str(archive_path), parallelization=os.cpu_count() or 1
+            )
+            return io.BufferedReader(gz, buffer_size=_FILE_BUFSIZE), "r|"
+        if igzip is not None:
+            gz = igzip.IGzipFile(str(archive_path), "rb")
+            _advise_sequential(gz)
+            return io.BufferedReader(gz, buffer_size=_FILE_BUFSIZE), "r|"
+        gz = gzip.GzipFile(str(archive_path), "rb")
+        _advise_sequential(gz)
+        return io.BufferedReader(gz, buffer_size=_FILE_BUFSIZE), "r|"
+
+    def _add_model_files(self, tar: tarfile.TarFile, model_path: Path) -> None:
+        """Add all files under *model_path* to an open tar, one at a time.
+
+        With S3MODELCACHE_READAHEAD set (Linux), readahead hints for every
+        file are queued up front on a small pool so disk reads overlap the
+        compression instead of alternating with it.
+        """
+        entries = list(_iter_files(model_path))
+        prefetch_pool = None
+        if _readahead_enabled():
+            prefetch_pool = ThreadPoolExecutor(max_workers=2)
+            for abs_path, _, _ in entries:
+                prefetch_pool.submit(_readahead, abs_path)
+        for abs_path, size, rel in entries:
+            # gettarinfo on the open handle fstats it once and addfile
+            # streams from it directly — tar.add would stat and open the
+            # path a second time.
+            with open(abs_path, "rb", buffering=_FILE_BUFSIZE) as fobj:
+                tarinfo = tar.gettarinfo(
+                    abs_path, arcname=f"{model_path.name}/{rel}", fileobj=fobj
+                )
+                tar.addfile(tarinfo, fobj)
+
+            # Log progress for large operations; the isEnabledFor guard keeps
+            # the per-file formatting out of the loop when INFO is off.
+            if size > _LARGE_FILE_LOG_THRESHOLD and logger.isEnabledFor(logging.INFO):
+                logger.info("Added large file: %s (%.1f MB)",
+                          os.path.basename(abs_path), size / (1024 * 1024))
+        if prefetch_pool is not None:
+            prefetch_pool.shutdown(wait=False, cancel_futures=True)
+
+    def _compress_model_tarfile(
+        self, model_path: Path, archive_path: Path, level: Optional[int] = None
+    ) -> None:
+        """Pure-Python fallback used when tar/pigz are not installed."""
+        fobj, mode = self._open_archive_for_write(archive_path, level)
+        with fobj, tarfile.open(fileobj=fobj, mode=mode, bufsize=_STREAM_BUFSIZE, copybufsize=_COPY_BUFSIZE) as tar:
+            self._add_model_files(tar, model_path)
+
+    def _wrap_stream_compressor(self, fileobj, level: Optional[int] = None):
+        """Wrap *fileobj* in the configured streaming compressor.
+
+        Returns ``(comp, mode)`` where *comp* is the object to hand to
+        ``tarfile.open`` and *mode* the matching streaming tar mode. When
+        *comp* is not *fileobj* itself, the caller must close it to flush the
+        compressor footer (the sink stays open).
+        """
+        if level is None:
+            level = self.compression_level
+        if self.archive_format == "tar.zst":
+            comp = zstandard.ZstdCompressor(
+                level=max(level, 1), threads=-1
+            ).stream_writer(fileobj, closefd=False)
+            return comp, "w|"
+        if self.archive_format == "tar.gz" and igzip is not None:
+            # ISA-L only implements levels 0-3.
+            return igzip.IGzipFile(
+                fileobj=fileobj, mode="wb",
+                compresslevel=min(level, 3),
+            ), "w|"
+        if self.archive_format == "tar.gz":
+            # GzipFile honours the level (tarfile's "w|gz" would hardwire 9)
+            # and leaves the sink open on close; mtime=0 makes the output
+            # reproducible across runs.
+            return gzip.GzipFile(
+                fileobj=fileobj, mode="wb", compresslevel=level, mtime=0
+            ), "w|"
+        return fileobj, "w|"  # plain tar
+
+    def _wrap_stream_decompressor(self, fileobj):
+        """Read-side mirror of :meth:`_wrap_stream_compressor`.
+
+        Returns ``(decomp, mode)`` for a non-seekable source such as a
+        ``get_object`` streaming body; all modes are forward-only.
+        """
+        if self.archive_format == "tar.zst":
+            return zstandard.ZstdDecompressor().stream_reader(fileobj), "r|"
+        if self.archive_format == "tar.gz" and igzip is not None:
+            return igzip.IGzipFile(fileobj=fileobj, mode="rb"), "r|"
+        if self.archive_format == "tar.gz":
+            return fileobj, "r|gz"
+        return fileobj, "r|"  # plain tar
+
+    def _compress_model_into(self, model_path: Path, fileobj) -> None:
+        """Compress *model_path* as a streaming tar into an arbitrary sink.
+
+        The sink is not closed; the caller owns its lifetime. Used by
+        :meth:`_stream_compress_to_s3` so archive bytes go straight to the
+        multipart uploader without touching disk.
+        """
+        comp, mode = self._wrap_stream_compressor(
+            fileobj, self._effective_level(model_path)
+        )
+        with tarfile.open(fileobj=comp, mode=mode, bufsize=_STREAM_BUFSIZE, copybufsize=_COPY_BUFSIZE) as tar:
+            self._add_model_files(tar, model_path)
+        if comp is not fileobj:
+            # Flush the compressor footer without closing the sink.
+            comp.close()
+
+    def _pipelined_cache_to_s3(
+        self,
+        model_id: str,
+        local_model_path: Path,
+        s3_key: str,
+        *,
+        if_none_match: bool = False,
+    ) -> None:
+        """Download from HuggingFace and upload to S3 in one overlapped pass.
+
+        Files are fetched concurrently with ``hf_hub_download``; each file is
+        appended to the streaming tar (and thus the multipart upload) as soon
+        as its download completes, instead of waiting for the whole snapshot.
+        For a large model this roughly halves wall time versus
+        download-then-compress-then-upload.
+        """
+        from huggingface_hub import hf_hub_download, list_repo_files
+
+        filenames = list_repo_files(model_id)
+        logger.info(
+            "Pipelining %d files: HF %s -> s3://%s/%s",
+            len(filenames), model_id, self.bucket_name, s3_key,
+        )
+
+        writer = _S3MultipartWriter(
+            self.s3_client, self.bucket_name, s3_key, if_none_match=if_none_match
+        )
+        hasher = _HashingWriter(writer)
+        try:
+            comp, mode = self._wrap_stream_compressor(hasher)
+            with ThreadPoolExecutor(
+                max_workers=min(16, (os.cpu_count() or 1) * 2)
+            ) as executor, tarfile.open(
+                fileobj=comp, mode=mode, bufsize=_STREAM_BUFSIZE, copybufsize=_COPY_BUFSIZE
+            ) as tar:
+                futures = {
+                    executor.submit(
+                        hf_hub_download,
+                        repo_id=model_id,
+                        filename=filename,
+                        local_dir=str(local_model_path),
+                    ): filename
+                    for filename in filenames
+                }
+                # Append files in completion order; tar member order is
+                # irrelevant for extraction.
+                for future in as_completed(futures):
+                    filename = futures[future]
+                    tar.add(
+                        future.result(),
+                        arcname=f"{local_model_path.name}/{filename}",
+                    )
+            if comp is not hasher:
+                comp.close()
+            writer.close()
+        except Exception:
+            writer.abort()
+            raise
+        self._put_digest(s3_key, hasher.digest.hexdigest())
+
+    def _stream_compress_to_s3(
+        self, model_path: Path, s3_key: str, *, if_none_match: bool = False
+    ) -> None:
+        """Compress and multipart-upload *model_path* in one streaming pass."""
+        logger.info(
+            "Streaming %s -> s3://%s/%s", model_path, self.bucket_name, s3_key
+        )
+        writer = _S3MultipartWriter(
+            self.s3_client, self.bucket_name, s3_key, if_none_match=if_none_match
+        )
+        hasher = _HashingWriter(writer)
+        try:
+            self._compress_model_into(model_path, hasher)
+            writer.close()
+        except Exception:
+            writer.abort()
+            raise
+        self._put_digest(s3_key, hasher.digest.hexdigest())
+
+    def _extract_model_external(self, archive_path: Path, extract_dir: Path) -> None:
+        """Extract via ``pigz -dc | tar -x`` for multi-core gzip throughput.
+
+        Mirrors :meth:`_compress_model_external`: decompression runs outside
+        the GIL across all cores, with tar consuming the plain stream.
+        """
+        pigz_proc = subprocess.Popen(
+            ["pigz", "-dc", str(archive_path)],
+            stdout=subprocess.PIPE,
+        )
+        tar_proc = subprocess.Popen(
+            ["tar", "-xf", "-", "-C", str(extract_dir.parent)],
+            stdin=pigz_proc.stdout,
+        )
+        # Allow pigz to receive SIGPIPE if tar exits early.
+        pigz_proc.stdout.close()
+        tar_rc = tar_proc.wait()
+        pigz_rc = pigz_proc.wait()
+        if tar_rc or pigz_rc:
+            raise RuntimeError(
+                f"External extraction pipeline failed (pigz={pigz_rc}, tar={tar_rc})"
+            )
+
+    def _stream_extract_external(self, body, extract_dir: Path) -> None:
+        """Pump an S3 streaming body through ``pigz -dc | tar -x``.
+
+        Same pipeline as :meth:`_extract_model_external`, but fed from the
+        network instead of a local archive file.
+        """
+        pigz_proc = subprocess.Popen(
+            ["pigz", "-dc"],
+            stdin=subprocess.PIPE,
+            stdout=subprocess.PIPE,
+        )
+        tar_proc = subprocess.Popen(
+            ["tar", "-xf", "-", "-C", str(extract_dir.parent)],
+            stdin=pigz_proc.stdout,
+        )
+        pigz_proc.stdout.close()
+        try:
+            shutil.copyfileobj(body, pigz_proc.stdin, _COPY_BUFSIZE)
+        finally:
+            pigz_proc.stdin.close()
+        tar_rc = tar_proc.wait()
+        pigz_rc = pigz_proc.wait()
+        if tar_rc or pigz_rc:
+            raise RuntimeError(
+                f"External extraction pipeline failed (pigz={pigz_rc}, tar={tar_rc})"
+            )
+
+    def _stream_extract_from_s3(self, s3_key: str, extract_dir: Path) -> bool:
+        """Extract the archive at *s3_key* directly from the GET stream.
+
+        Bytes are decompressed and written to disk as they arrive, so the
+        network transfer overlaps extraction and no temporary archive file
+        is ever written — one pass over the data instead of two.
+        """
+        try:
+            # Ranged GETs a few blocks ahead of the extractor keep the
+            # network busy while tar writes; the constructor's first range
+            # request doubles as the existence check.
+            body = _RollingPrefetchReader(self.s3_client, self.bucket_name, s3_key)
+        except ClientError as exc:
+            logger.error("Download failed: %s", exc)
+            return False
+
+        logger.info(
+            "Streaming s3://%s/%s -> %s", self.bucket_name, s3_key, extract_dir
+        )
+        with body:
+            if (
+                self.archive_format == "tar.gz"
+                and shutil.which("tar")
+                and shutil.which("pigz")
+            ):
+                self._stream_extract_external(body, extract_dir)
+                return True
+
+            decomp, mode = self._wrap_stream_decompressor(body)
+            with _LoggingTarFile.open(
+                fileobj=decomp, mode=mode, bufsize=_STREAM_BUFSIZE, copybufsize=_COPY_BUFSIZE
+            ) as tar:
+                tar.extractall(path=str(extract_dir.parent), filter="data")
+        return True
+
+    def _put_digest(self, s3_key: str, hexdigest: str) -> None:
+        """Store the archive's sha256 as a tiny sidecar object (best effort)."""
+        try:
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=f"{s3_key}.sha256",
+                Body=hexdigest.encode("ascii"),
+            )
+        except ClientError as exc:
+            logger.warning("Could not write digest sidecar for %s: %s", s3_key, exc)
+
+    def _put_manifest(self, s3_key: str, digest: str) -> None:
+        """Store the source manifest digest as a sidecar object (best effort)."""
+        try:
+            self.s3_client.put_object(
+                Bucket=self.bucket_name,
+                Key=f"{s3_key}.manifest",
+                Body=digest.encode("ascii"),
+            )
+        except ClientError as exc:
+            logger.warning("Could not write manifest sidecar for %s: %s", s3_key, exc)
+
+    def _get_remote_manifest(self, s3_key: str) -> Optional[str]:
+        """Fetch the manifest sidecar for *s3_key*, or ``None`` if absent."""
+        try:
+            resp = self.s3_client.get_object(
+                Bucket=self.bucket_name, Key=f"{s3_key}.manifest"
+            )
+            return resp["Body"].read().decode("ascii")
+        except ClientError:
+            return None
 
     def _extract_model(self, archive_path: Path, extract_dir: Path) -> None:
         """Extract model archive with memory-efficient streaming.
@@ -143,73 +1186,193 @@ class S3ModelCache:
         with large model archives.
         """
         logger.info("Extracting %s -> %s", archive_path, extract_dir)
-        
-        with tarfile.open(archive_path, "r:gz") as tar:
-            # Extract files one by one for better memory control
-            for member in tar.getmembers():
-                if member.isfile():
-                    # Log progress for large files
-                    if member.size > 100 * 1024 * 1024:  # > 100MB
-                        logger.info("Extracting large file: %s (%.1f MB)", 
-                                  member.name, member.size / (1024*1024))
-                    
-                    tar.extract(member, extract_dir.parent)
-                elif member.isdir():
-                    # Create directories
-                    tar.extract(member, extract_dir.parent)
+
+        if (
+            self.archive_format == "tar.gz"
+            and shutil.which("tar")
+            and shutil.which("pigz")
+        ):
+            self._extract_model_external(archive_path, extract_dir)
+            return
+
+        fobj, mode = self._open_archive_for_read(archive_path)
+        with fobj, _LoggingTarFile.open(
+            fileobj=fobj, mode=mode, bufsize=_STREAM_BUFSIZE, copybufsize=_COPY_BUFSIZE
+        ) as tar:
+            # extractall runs the batch extraction path (single forward pass,
+            # works with the streaming read modes) and applies the PEP 706
+            # "data" filter once instead of per Python-level extract call.
+            tar.extractall(path=str(extract_dir.parent), filter="data")
+        # The archive was read once and is usually unlinked right after;
+        # don't let its pages linger in the cache.
+        _advise_dontneed(archive_path)
 
     def _upload_to_s3(self, local_file: Path, s3_key: str) -> bool:
         try:
-            self.s3_client.upload_file(str(local_file), self.bucket_name, s3_key)
+            if local_file.stat().st_size < _SINGLE_PUT_MAX:
+                # One plain PUT: no multipart bookkeeping, no thread pool.
+                with open(local_file, "rb", buffering=_FILE_BUFSIZE) as fobj:
+                    self.s3_client.put_object(
+                        Bucket=self.bucket_name, Key=s3_key, Body=fobj
+                    )
+            else:
+                self.s3_client.upload_file(
+                    str(local_file),
+                    self.bucket_name,
+                    s3_key,
+                    Config=self._transfer_config,
+                )
+            # One-shot read of a large archive: release its page cache.
+            _advise_dontneed(local_file)
             return True
-        except ClientError as exc:
+        except (ClientError, OSError) as exc:
             logger.error("Upload failed: %s", exc)
             return False
 
+    def _is_up_to_date(self, s3_key: str, local_file: Path) -> bool:
+        """True when *local_file* already matches the remote object's size.
+
+        One ~1 KB HEAD against a size compare; snapshot archives are written
+        once, so a size match is as good as an ETag here (multipart ETags
+        are not content hashes anyway).
+        """
+        if not local_file.exists():
+            return False
+        try:
+            head = self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
+        except ClientError:
+            return False
+        return local_file.stat().st_size == head["ContentLength"]
+
     def _download_from_s3(self, s3_key: str, local_file: Path) -> bool:
+        if self._is_up_to_date(s3_key, local_file):
+            logger.info("Local copy of %s is current; skipping download", s3_key)
+            return True
         try:
-            self.s3_client.download_file(self.bucket_name, s3_key, str(local_file))
+            self.s3_client.download_file(
+                self.bucket_name,
+                s3_key,
+                str(local_file),
+                Config=self._download_transfer_config,
+            )
             return True
         except ClientError as exc:
             logger.error("Download failed: %s", exc)
             return False
 
+    def _head_cache_fresh(self, cache_key: str) -> bool:
+        """True if *cache_key* was positively checked within the TTL."""
+        checked_at = self._head_cache.get(cache_key)
+        return checked_at is not None and time.monotonic() - checked_at < _HEAD_CACHE_TTL
+
     def _model_exists_in_s3(self, s3_key: str) -> bool:
+        if self._s3_inventory is not None and s3_key in self._s3_inventory:
+            return True
+        if self._head_cache_fresh(s3_key):
+            return True
         try:
             self.s3_client.head_object(Bucket=self.bucket_name, Key=s3_key)
-            return True
         except ClientError:
+            # A freshly written primary may not be visible yet on eventually
+            # consistent stores; the mirror copy is older and therefore more
+            # likely to have propagated.
+            mirror = self._mirror_key(s3_key)
+            if mirror is not None:
+                try:
+                    self.s3_client.head_object(Bucket=self.bucket_name, Key=mirror)
+                except ClientError:
+                    return False
+                self._head_cache[s3_key] = time.monotonic()
+                return True
+            # Only positive results are cached: a missing object may appear
+            # at any moment (e.g. right after our own upload).
             return False
+        self._head_cache[s3_key] = time.monotonic()
+        return True
 
     def _model_dir_exists_in_s3(self, model_id: str) -> bool:
         """Return True if any object exists under the model's directory prefix."""
         prefix = self._get_s3_prefix_for_dir(model_id)
+        if self._head_cache_fresh(prefix):
+            return True
         resp = self.s3_client.list_objects_v2(Bucket=self.bucket_name, Prefix=prefix, MaxKeys=1)
-        return resp.get("KeyCount", 0) > 0
+        if resp.get("KeyCount", 0) > 0:
+            self._head_cache[prefix] = time.monotonic()
+            return True
+        return False
+
+    def _upload_dir_file(self, path: str, key: str, size: int) -> None:
+        """Upload one directory-mode file, routed by size.
+
+        Config-sized files skip the transfer manager's future/task machinery
+        entirely with one plain PUT (same cutoff as :meth:`_upload_to_s3`);
+        weight shards keep the multipart path.
+        """
+        if size < _SINGLE_PUT_MAX:
+            with open(path, "rb", buffering=_FILE_BUFSIZE) as fobj:
+                self.s3_client.put_object(Bucket=self.bucket_name, Key=key, Body=fobj)
+        else:
+            self.s3_client.upload_file(
+                path, self.bucket_name, key, Config=self._dir_transfer_config
+            )
 
     def _upload_dir_to_s3(self, local_dir: Path, model_id: str) -> bool:
-        """Upload a local model directory to S3, preserving relative paths."""
+        """Upload a local model directory to S3, preserving relative paths.
+
+        Files are uploaded concurrently (``max_upload_concurrency`` at a
+        time); on the first failure the remaining queued uploads are
+        cancelled, matching the previous fail-fast semantics.
+
+        Files whose key already exists remotely with the same byte size are
+        skipped. snapshot_download output is content-stable, so a re-upload
+        of a model that shares shards with what is already in the bucket
+        (interrupted earlier run, force_upload refresh) transfers only the
+        missing or changed files; one LIST replaces per-file HEADs.
+        """
         prefix = self._get_s3_prefix_for_dir(model_id)
-        success = True
-        for path in local_dir.rglob("*"):
-            if not path.is_file():
+        remote_sizes: dict[str, int] = {}
+        paginator = self.s3_client.get_paginator("list_objects_v2")
+        for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
+            for obj in page.get("Contents", []):
+                remote_sizes[obj["Key"]] = obj["Size"]
+        files = []
+        for abs_path, size, rel in _iter_files(local_dir):
+            key = prefix + rel
+            if remote_sizes.get(key) == size:
                 continue
-            rel = path.relative_to(local_dir)
-            key = prefix + str(rel).replace("\\", "/")
-            try:
-                self.s3_client.upload_file(str(path), self.bucket_name, key)
-            except ClientError as exc:
-                logger.error("Upload of %s failed: %s", key, exc)
-                success = False
-                break
+            files.append((abs_path, key, size))
+        if not files:
+            logger.info("All files already present under %s", prefix)
+            return True
+        success = True
+        with ThreadPoolExecutor(max_workers=self.max_upload_concurrency) as executor:
+            futures = {
+                executor.submit(self._upload_dir_file, path, key, size): key
+                for path, key, size in files
+            }
+            for future in as_completed(futures):
+                try:
+                    future.result()
+                except (ClientError, OSError) as exc:
+                    logger.error("Upload of %s failed: %s", futures[future], exc)
+                    success = False
+                    for pending in futures:
+                        pending.cancel()
+                    break
         return success
 
     def _download_dir_from_s3(self, model_id: str, local_dir: Path) -> bool:
-        """Download all objects for a model directory from S3 into *local_dir*."""
+        """Download all objects for a model directory from S3 into *local_dir*.
+
+        Listing and transfer are split into two phases: keys are collected
+        first, target directories are created once, then files are fetched
+        concurrently so a single slow object no longer blocks the rest.
+        """
         prefix = self._get_s3_prefix_for_dir(model_id)
         paginator = self.s3_client.get_paginator("list_objects_v2")
         local_dir.mkdir(parents=True, exist_ok=True)
-        success = False
+
+        targets: list[tuple[str, Path]] = []
         for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
             for obj in page.get("Contents", []):
                 key = obj["Key"]
@@ -217,19 +1380,43 @@ class S3ModelCache:
                 rel = key[len(prefix) :]
                 if not rel:
                     continue
-                dest = local_dir / rel
-                dest.parent.mkdir(parents=True, exist_ok=True)
+                targets.append((key, local_dir / rel))
+        if not targets:
+            logger.error("Model directory not found in S3 under prefix %s", prefix)
+            return False
+
+        # Create parent directories up front to avoid mkdir contention
+        # between download threads.
+        for parent in {dest.parent for _, dest in targets}:
+            parent.mkdir(parents=True, exist_ok=True)
+
+        success = True
+        with ThreadPoolExecutor(max_workers=self.max_upload_concurrency) as executor:
+            futures = {
+                executor.submit(
+                    self.s3_client.download_file,
+                    self.bucket_name,
+                    key,
+                    str(dest),
+                    Config=self._dir_transfer_config,
+                ): key
+                for key, dest in targets
+            }
+            for future in as_completed(futures):
                 try:
-                    self.s3_client.download_file(self.bucket_name, key, str(dest))
-                    success = True
+                    future.result()
                 except ClientError as exc:
-                    logger.error("Download of %s failed: %s", key, exc)
-                    return False
+                    logger.error("Download of %s failed: %s", futures[future], exc)
+                    success = False
+                    for pending in futures:
+                        pending.cancel()
+                    break
         return success
 
     # ───────────────────────────────── Public API ──────────────────────────────
     def cache_model_to_s3(self, model_id: str, force_upload: bool = False) -> bool:
         local_model_path = self._get_local_path(model_id)
+        self._ensure_bucket()
 
         if self.store_as_archive:
             s3_key = self._get_s3_key(model_id)
@@ -242,10 +1429,30 @@ class S3ModelCache:
                 return True
 
         if not local_model_path.exists():
+            if self.store_as_archive:
+                # Overlap HF download with the streaming S3 upload instead of
+                # running the two phases back to back.
+                try:
+                    self._pipelined_cache_to_s3(
+                        model_id,
+                        local_model_path,
+                        self._get_s3_key(model_id),
+                        if_none_match=not force_upload,
+                    )
+                    if self._s3_inventory is not None:
+                        self._s3_inventory.add(self._get_s3_key(model_id))
+                    self._mirror_object(self._get_s3_key(model_id))
+                    return True
+                except Exception as exc:  # pragma: no cover – network errors in CI
+                    logger.error("Pipelined download/upload failed: %s", exc)
+                    self.delete_cached_model(model_id, local=True, s3=True)
+                    return False
             try:
                 snapshot_download(
                     repo_id=model_id,
                     local_dir=str(local_model_path),
+                    max_workers=min(32, (os.cpu_count() or 1) * 4),
+                    etag_timeout=30,
                 )
             except Exception as exc:  # pragma: no cover – network errors in CI
                 logger.error("HuggingFace download failed: %s", exc)
@@ -253,47 +1460,174 @@ class S3ModelCache:
                 # inconsistent state on the next run.
                 self.delete_cached_model(model_id, local=True, s3=True)
                 return False
+        else:
+            # The directory may be a partial snapshot from a crashed run.
+            # Re-running snapshot_download is cheap when everything is
+            # present (per-file etag HEADs, no re-download) and completes
+            # the snapshot when it is not. Failure here (e.g. offline) is
+            # non-fatal: the existing files are still usable.
+            try:
+                snapshot_download(
+                    repo_id=model_id,
+                    local_dir=str(local_model_path),
+                    max_workers=min(32, (os.cpu_count() or 1) * 4),
+                    etag_timeout=30,
+                )
+            except Exception as exc:  # pragma: no cover – network errors in CI
+                logger.warning(
+                    "Could not verify local snapshot of %s: %s", model_id, exc
+                )
 
         if self.store_as_archive:
-            archive_path = self.local_cache_dir / f"{local_model_path.name}.tar.gz"
-            self._compress_model(local_model_path, archive_path)
             s3_key = self._get_s3_key(model_id)
-            success = self._upload_to_s3(archive_path, s3_key)
-            if not success:
-                # Upload failed – ensure we don't leave a broken object in S3 or a
-                # misleading local cache directory behind.
-                self.delete_cached_model(model_id, local=True, s3=True)
-            archive_path.unlink(missing_ok=True)
-            return success
+            # Content dedupe: if the manifest sidecar in S3 matches the local
+            # snapshot's manifest digest, the uploaded archive was built from
+            # identical content — skip recompressing and re-uploading it even
+            # on force_upload.
+            digest = _manifest_digest(local_model_path)
+            if self._get_remote_manifest(s3_key) == digest:
+                logger.info(
+                    "Archive for %s already matches the local snapshot; skipping upload",
+                    model_id,
+                )
+                return True
+            # Stream compression straight into a multipart upload: no local
+            # archive file, no second pass over the data, and compression
+            # overlaps the network PUTs.
+            try:
+                self._stream_compress_to_s3(
+                    local_model_path, s3_key, if_none_match=not force_upload
+                )
+            except (ClientError, OSError, RuntimeError) as exc:
+                # Fall back to the disk-based path: write the archive out,
+                # then upload it whole. Slower (two passes over the data),
+                # but it retries a transient mid-stream failure without
+                # re-snapshotting the model.
+                logger.warning(
+                    "Streaming upload failed: %s; retrying via an archive on disk",
+                    exc,
+                )
+                archive_path = self.local_cache_dir / (
+                    local_model_path.name + self._archive_suffix
+                )
+                try:
+                    self._compress_model(local_model_path, archive_path)
+                    uploaded = self._upload_to_s3(archive_path, s3_key)
+                except (OSError, RuntimeError) as exc:
+                    logger.error("Fallback archive upload failed: %s", exc)
+                    uploaded = False
+                finally:
+                    archive_path.unlink(missing_ok=True)
+                if not uploaded:
+                    # Ensure we don't leave a broken object in S3 or a
+                    # misleading local cache directory behind.
+                    self.delete_cached_model(model_id, local=True, s3=True)
+                    return False
+            self._put_manifest(s3_key, digest)
+            if self._s3_inventory is not None:
+                self._s3_inventory.add(s3_key)
+            self._mirror_object(s3_key)
+            return True
         # Directory mode: upload all files under a model-specific prefix
         success = self._upload_dir_to_s3(local_model_path, model_id)
         if not success:
             self.delete_cached_model(model_id, local=True, s3=True)
         return success
 
+    def cache_models_to_s3(
+        self, model_ids: list[str], *, force_upload: bool = False, max_workers: int = 4
+    ) -> dict[str, bool]:
+        """Cache several models concurrently; returns per-model success.
+
+        Each model already parallelizes internally (snapshot fetch, multipart
+        parts), so a handful of workers at this level is enough to keep the
+        pipe full between models without oversubscribing the client's
+        connection pool. The single client is thread-safe and shared.
+        """
+        results: dict[str, bool] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(self.cache_model_to_s3, model_id, force_upload): model_id
+                for model_id in model_ids
+            }
+            for future in as_completed(futures):
+                model_id = futures[future]
+                try:
+                    results[model_id] = future.result()
+                except Exception as exc:
+                    # One model's failure must not abort the whole batch.
+                    logger.error("Caching %s failed: %s", model_id, exc)
+                    results[model_id] = False
+        return results
+
+    def load_models_from_s3(
+        self, model_ids: list[str], *, max_workers: int = 4
+    ) -> dict[str, Optional[Path]]:
+        """Load several models concurrently; returns per-model local path."""
+        results: dict[str, Optional[Path]] = {}
+        with ThreadPoolExecutor(max_workers=max_workers) as pool:
+            futures = {
+                pool.submit(self.load_model_from_s3, model_id): model_id
+                for model_id in model_ids
+            }
+            for future in as_completed(futures):
+                model_id = futures[future]
+                try:
+                    results[model_id] = future.result()
+                except Exception as exc:
+                    logger.error("Loading %s failed: %s", model_id, exc)
+                    results[model_id] = None
+        return results
+
     def load_model_from_s3(self, model_id: str, *, keep_local: bool = True) -> Optional[Path]:
         local_model_path = self._get_local_path(model_id)
 
         if local_model_path.exists():
             return local_model_path
+        self._ensure_bucket()
         if self.store_as_archive:
+            # No pre-HEAD: the GET itself reports a missing key, so probing
+            # first would just double the round-trips on the common hit path.
             s3_key = self._get_s3_key(model_id)
-            if not self._model_exists_in_s3(s3_key):
-                logger.error("Model not found in S3: %s", s3_key)
-                return None
-            archive_path = self.local_cache_dir / f"{local_model_path.name}.tar.gz"
-            if not self._download_from_s3(s3_key, archive_path):
-                return None
             try:
-                self._extract_model(archive_path, local_model_path)
-            finally:
-                archive_path.unlink(missing_ok=True)
+                # Extract straight off the GET stream: no temporary archive
+                # on disk, and network transfer overlaps extraction.
+                if not self._stream_extract_from_s3(s3_key, local_model_path):
+                    mirror = self._mirror_key(s3_key)
+                    if mirror is None or not self._stream_extract_from_s3(
+                        mirror, local_model_path
+                    ):
+                        return None
+            except Exception as exc:
+                # A mid-stream failure leaves a partial model directory that
+                # would otherwise pass the local-cache check on the next call.
+                shutil.rmtree(local_model_path, ignore_errors=True)
+                # Fall back to the disk-based path: fetch the archive whole
+                # (skipped if a current copy survives from an earlier run),
+                # then extract it locally.
+                logger.warning(
+                    "Streaming extract of %s failed: %s; retrying via an archive on disk",
+                    s3_key,
+                    exc,
+                )
+                archive_path = self.local_cache_dir / (
+                    local_model_path.name + self._archive_suffix
+                )
+                if not self._download_from_s3(s3_key, archive_path):
+                    return None
+                try:
+                    self._extract_model(archive_path, local_model_path)
+                except (OSError, tarfile.TarError, RuntimeError) as exc:
+                    logger.error("Fallback extract failed: %s", exc)
+                    shutil.rmtree(local_model_path, ignore_errors=True)
+                    return None
+                finally:
+                    archive_path.unlink(missing_ok=True)
             return local_model_path
 
-        # Directory mode: download all files under the model prefix
-        if not self._model_dir_exists_in_s3(model_id):
-            logger.error("Model directory not found in S3 under prefix %s", self._get_s3_prefix_for_dir(model_id))
-            return None
+        # Directory mode: download all files under the model prefix. The
+        # listing inside the download doubles as the existence check, so no
+        # separate probe round-trip is needed.
         if not self._download_dir_from_s3(model_id, local_model_path):
             return None
         return local_model_path
@@ -324,27 +1658,95 @@ class S3ModelCache:
         """
         source = source.lower()
         if source == "local":
-            return [p.name for p in self.local_cache_dir.iterdir() if p.is_dir()]
+            # scandir's DirEntry answers is_dir() from the cached dirent,
+            # skipping the per-entry stat() that Path.is_dir() would issue.
+            with os.scandir(self.local_cache_dir) as entries:
+                return [e.name for e in entries if e.is_dir(follow_symlinks=False)]
         if source == "s3":
+            # Shallow listing: with Delimiter="/" S3 groups directory-mode
+            # models into CommonPrefixes server-side, so the response is
+            # O(models) instead of O(files) — archives live as flat keys
+            # directly under the prefix and arrive in Contents either way.
             paginator = self.s3_client.get_paginator("list_objects_v2")
-            models: list[str] = []
-            for page in paginator.paginate(Bucket=self.bucket_name, Prefix=self.s3_prefix):
+            pages = paginator.paginate(
+                Bucket=self.bucket_name,
+                Prefix=self.s3_prefix,
+                Delimiter="/",
+                PaginationConfig={"PageSize": 1000},
+            )
+            models: set[str] = set()
+            keys: set[str] = set()
+            for page in pages:
                 for obj in page.get("Contents", []):
                     key = obj["Key"]
-                    if self.store_as_archive:
-                        if key.endswith(".tar.gz"):
-                            models.append(key[len(self.s3_prefix):-7])  # strip prefix + ext
-                    else:
-                        # Directory mode: collect top-level model prefixes
-                        rest = key[len(self.s3_prefix):]
-                        if not rest:
-                            continue
-                        model_name = rest.split("/", 1)[0]
-                        if model_name and model_name not in models:
-                            models.append(model_name)
-            return models
+                    keys.add(key)
+                    if key.endswith(self._archive_suffix):
+                        models.add(
+                            key.removeprefix(self.s3_prefix).removesuffix(self._archive_suffix)
+                        )
+                for common in page.get("CommonPrefixes", []):
+                    name = common["Prefix"][len(self.s3_prefix):].rstrip("/")
+                    if name:
+                        models.add(name)
+            if self.store_as_archive:
+                # Flat archive layout: the shallow listing saw every key
+                # under the prefix, so it doubles as the existence-probe
+                # inventory.
+                self._s3_inventory = keys
+            return sorted(models)
         raise ValueError("source must be 'local' or 's3'")
 
+    def delete_cached_models(
+        self, model_ids: list[str], *, local: bool = True, s3: bool = False
+    ) -> bool:
+        """Delete several cached models at once.
+
+        Archive-mode S3 deletes are batched through ``delete_objects`` in
+        1000-key calls (archive, sidecars and any mirror copy), so removing
+        N models costs a few requests instead of several per model. Returns
+        ``True`` if at least one deletion succeeded.
+        """
+        success = False
+        if local:
+            for model_id in model_ids:
+                local_path = self._get_local_path(model_id)
+                if local_path.exists():
+                    _rmtree_fast(local_path)
+                    success = True
+        if s3:
+            if not self.store_as_archive:
+                # Directory mode already bulk-deletes per model prefix.
+                for model_id in model_ids:
+                    if self.delete_cached_model(model_id, local=False, s3=True):
+                        success = True
+                return success
+            keys: list[str] = []
+            for model_id in model_ids:
+                key = self._get_s3_key(model_id)
+                self._head_cache.pop(key, None)
+                if self._s3_inventory is not None:
+                    self._s3_inventory.discard(key)
+                keys.extend((key, f"{key}.sha256", f"{key}.manifest"))
+                # The mirror copy would otherwise resurrect the model through
+                # _model_exists_in_s3's fallback HEAD.
+                mirror = self._mirror_key(key)
+                if mirror is not None:
+                    keys.append(mirror)
+            for start in range(0, len(keys), 1000):
+                batch = keys[start : start + 1000]
+                try:
+                    self.s3_client.delete_objects(
+                        Bucket=self.bucket_name,
+                        Delete={
+                            "Objects": [{"Key": k} for k in batch],
+                            "Quiet": True,
+                        },
+                    )
+                    success = True
+                except ClientError as exc:
+                    logger.error("Bulk delete failed: %s", exc)
+        return success
+
     def delete_cached_model(self, model_id: str, *, local: bool = True, s3: bool = False) -> bool:
         """Delete cached model locally and/or from S3.
 
@@ -354,30 +1756,69 @@ class S3ModelCache:
         if local:
             local_path = self._get_local_path(model_id)
             if local_path.exists():
-                shutil.rmtree(local_path, ignore_errors=True)
+                _rmtree_fast(local_path)
                 success = True
         if s3:
             if self.store_as_archive:
                 key = self._get_s3_key(model_id)
+                self._head_cache.pop(key, None)
+                if self._s3_inventory is not None:
+                    self._s3_inventory.discard(key)
                 try:
                     self.s3_client.delete_object(Bucket=self.bucket_name, Key=key)
                     success = True
                 except ClientError as exc:
                     logger.error("Failed to delete %s from S3: %s", key, exc)
+                else:
+                    # Clean up the sidecars and the mirror copy too; leaving
+                    # the mirror behind would resurrect the model through
+                    # _model_exists_in_s3's fallback HEAD. Harmless if absent.
+                    extras = [f"{key}.sha256", f"{key}.manifest"]
+                    mirror = self._mirror_key(key)
+                    if mirror is not None:
+                        extras.append(mirror)
+                    for extra in extras:
+                        try:
+                            self.s3_client.delete_object(
+                                Bucket=self.bucket_name, Key=extra
+                            )
+                        except ClientError:
+                            pass
             else:
                 prefix = self._get_s3_prefix_for_dir(model_id)
+                self._head_cache.pop(prefix, None)
+                # A prefix delete removes an unknown set of keys; rebuild the
+                # inventory on next use rather than track them individually.
+                self._s3_inventory = None
                 paginator = self.s3_client.get_paginator("list_objects_v2")
-                to_delete: list[dict[str, str]] = []
-                for page in paginator.paginate(Bucket=self.bucket_name, Prefix=prefix):
-                    for obj in page.get("Contents", []):
-                        to_delete.append({"Key": obj["Key"]})
-                if to_delete:
-                    try:
-                        self.s3_client.delete_objects(
-                            Bucket=self.bucket_name,
-                            Delete={"Objects": to_delete},
-                        )
-                        success = True
-                    except ClientError as exc:
-                        logger.error("Failed to delete objects under %s from S3: %s", prefix, exc)
+
+                def _delete_batch(objects: list[dict[str, str]]) -> None:
+                    self.s3_client.delete_objects(
+                        Bucket=self.bucket_name,
+                        Delete={"Objects": objects, "Quiet": True},
+                    )
+
+                # delete_objects accepts at most 1000 keys per call, so flush
+                # batches as the paginator produces them instead of collecting
+                # every key first. Running the flushes on a small pool lets the
+                # next LIST page arrive while the previous batch deletes.
+                try:
+                    with ThreadPoolExecutor(max_workers=4) as pool:
+                        futures = []
+                        batch: list[dict[str, str]] = []
+                        for page in paginator.paginate(
+                            Bucket=self.bucket_name, Prefix=prefix
+                        ):
+                            for obj in page.get("Contents", []):
+                                batch.append({"Key": obj["Key"]})
+                                if len(batch) == 1000:
+                                    futures.append(pool.submit(_delete_batch, batch))
+                                    batch = []
+                        if batch:
+                            futures.append(pool.submit(_delete_batch, batch))
+                        for future in futures:
+                            future.result()
+                    success = bool(futures)
+                except ClientError as exc:
+                    logger.error("Failed to delete objects under %s from S3: %s", prefix, exc)
         return success
@@ -6,10 +6,10 @@ Function `upload_large_model_to_hcp` mirrors the helper originally found in
 from __future__ import annotations
 
 import logging
+import os
 from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 
-import boto3
 from boto3.s3.transfer import TransferConfig
 
 from .model_cache import S3ModelCache
@@ -18,12 +18,52 @@ logger = logging.getLogger(__name__)
 
 __all__ = ["upload_large_model_to_hcp"]
 
+# Archives below this size go up as a single PUT — multipart bookkeeping
+# costs more than it saves there.
+_SINGLE_PART_CUTOFF = 200 * 1024 * 1024
+
+
+def _max_concurrency() -> int:
+    """Scale part concurrency with installed RAM (one worker per GiB, 8-64).
+
+    Each in-flight part holds one chunk in memory, so RAM is the binding
+    resource rather than cores. The upper clamp matches the shared client's
+    max_pool_connections — more workers than pooled connections just queue.
+    """
+    try:
+        total = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_PHYS_PAGES")
+    except (ValueError, OSError):
+        total = 8 << 30
+    return max(8, min(64, total // (1 << 30)))
+
+
+def _tune_transfer(archive_size: int, chunk_size: int) -> tuple[int, int]:
+    """Return ``(chunk_size, max_concurrency)`` fitted to the archive and host.
+
+    The chunk is grown past the caller's value when needed to stay well
+    under S3's 10,000-part limit (targeting ~9,000 parts, capped at
+    512 MiB), and concurrency is clamped so roughly three in-flight
+    buffers per worker still fit in currently-available RAM.
+    """
+    chunk_size = max(chunk_size, min(512 << 20, archive_size // 9000))
+    max_conc = _max_concurrency()
+    try:
+        available = os.sysconf("SC_PAGE_SIZE") * os.sysconf("SC_AVPHYS_PAGES")
+    except (ValueError, OSError):
+        available = 8 << 30
+    max_conc = max(1, min(max_conc, available // (chunk_size * 3)))
+    logger.info(
+        "Transfer tuning: %d MiB parts, %d workers for %d MiB archive",
+        chunk_size >> 20, max_conc, archive_size >> 20,
+    )
+    return chunk_size, max_conc
+
 
 def upload_large_model_to_hcp(
     cache: S3ModelCache,
     model_id: str,
     *,
-    chunk_size: int = 100 * 1024 * 1024,  # 100 MB
+    chunk_size: int = 32 * 1024 * 1024,  # 32 MiB
 ) -> bool:
     """Upload *model_id* to S3 using multipart transfer.
 
@@ -34,35 +74,43 @@ def upload_large_model_to_hcp(
     model_id:
         HF model identifier.
     chunk_size:
-        Part/chunk size in bytes (default 100 MB).
+        Part/chunk size in bytes (default 32 MiB).
     """
     model_path = cache._get_local_path(model_id)
     s3_key = cache._get_s3_key(model_id)
 
-    archive_path = cache.local_cache_dir / f"{model_path.name}.tar.gz"
+    archive_path = cache.local_cache_dir / f"{model_path.name}{cache._archive_suffix}"
     if not archive_path.exists():
-        cache._compress_model(model_path, archive_path)
+        # No archive on disk yet: fuse compression and upload into one
+        # streaming multipart pass instead of writing the archive out and
+        # reading it straight back (two full passes of disk bandwidth).
+        try:
+            logger.info("Streaming multipart upload of %s -> %s", model_path, s3_key)
+            cache._stream_compress_to_s3(model_path, s3_key)
+            return True
+        except Exception as exc:  # pragma: no cover
+            logger.error("Multipart upload failed: %s", exc)
+            return False
 
+    archive_size = archive_path.stat().st_size
+    chunk_size, max_conc = _tune_transfer(archive_size, chunk_size)
     cfg = TransferConfig(
-        multipart_threshold=chunk_size,
+        # Small archives skip multipart entirely (single PUT).
+        multipart_threshold=(
+            chunk_size if archive_size >= _SINGLE_PART_CUTOFF else _SINGLE_PART_CUTOFF
+        ),
         multipart_chunksize=chunk_size,
-        max_concurrency=10,
+        max_concurrency=max_conc,
         use_threads=True,
-    )
-
-    # Reuse credentials from cache's client
-    creds = cache.s3_client._request_signer._credentials  # type: ignore[attr-defined]
-    s3_client = boto3.client(
-        "s3",
-        endpoint_url=cache.s3_endpoint,
-        aws_access_key_id=creds.access_key,
-        aws_secret_access_key=creds.secret_key,
-        config=boto3.session.Config(signature_version="s3v4"),
+        max_io_queue=max_conc * 2,
     )
 
     try:
         logger.info("Starting multipart upload of %s -> %s", archive_path, s3_key)
-        s3_client.upload_file(str(archive_path), cache.bucket_name, s3_key, Config=cfg)
+        # Reuse the cache's client: it already carries the endpoint, TLS
+        # setup and a warm connection pool sized for this concurrency, and
+        # avoids scraping credentials out of botocore private attributes.
+        cache.s3_client.upload_file(str(archive_path), cache.bucket_name, s3_key, Config=cfg)
         return True
     except Exception as exc:  # pragma: no cover
         logger.error("Multipart upload failed: %s", exc)
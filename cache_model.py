@@ -9,26 +9,16 @@ SRC_DIR = os.path.join(CURRENT_DIR, "src")
 if SRC_DIR not in sys.path:
     sys.path.insert(0, SRC_DIR)
 
-from s3modelcache import S3ModelCache
+from s3modelcache import S3CacheConfig, S3ModelCache
 
 
 def main() -> int:
-    model_id = os.getenv("MODEL_ID")
-    if not model_id:
+    cfg = S3CacheConfig.from_env()
+    if not cfg.model_id:
         print("ERROR: env MODEL_ID not set", file=sys.stderr)
         return 1
 
-    bucket = os.getenv("HCP_NAMESPACE") or os.getenv("S3_BUCKET")
-    endpoint = os.getenv("HCP_ENDPOINT") or os.getenv("S3_ENDPOINT")
-    access_key = os.getenv("HCP_ACCESS_KEY") or os.getenv("S3_ACCESS_KEY_ID")
-    secret_key = os.getenv("HCP_SECRET_KEY") or os.getenv("S3_SECRET_ACCESS_KEY")
-    region = os.getenv("HCP_REGION") or os.getenv("S3_REGION", "us-east-1")
-    s3_prefix = os.getenv("HCP_PREFIX") or os.getenv("S3_PREFIX", "models/")
-    verify_ssl = (os.getenv("HCP_VERIFY_SSL") or os.getenv("S3_VERIFY_SSL", "true")).lower() == "true"
-    root_ca_path = os.getenv("HCP_ROOT_CA_PATH") or os.getenv("S3_ROOT_CA_PATH") or None
-    store_as_archive = (os.getenv("HCP_STORE_AS_ARCHIVE") or os.getenv("S3_STORE_AS_ARCHIVE", "true")).lower() == "true"
-
-    if not bucket or not endpoint or not access_key or not secret_key:
+    if not cfg.complete:
         print(
             "ERROR: S3_* env vars not fully set (S3_BUCKET, S3_ENDPOINT, "
             "S3_ACCESS_KEY_ID, S3_SECRET_ACCESS_KEY)",
@@ -36,23 +26,10 @@ def main() -> int:
         )
         return 1
 
-    use_ssl = not endpoint.lower().startswith("http://")
-
-    cache = S3ModelCache(
-        bucket_name=bucket,
-        s3_endpoint=endpoint,
-        aws_access_key_id=access_key,
-        aws_secret_access_key=secret_key,
-        region_name=region,
-        s3_prefix=s3_prefix,
-        use_ssl=use_ssl,
-        verify_ssl=verify_ssl,
-        root_ca_path=root_ca_path,
-        store_as_archive=store_as_archive,
-    )
+    cache = S3ModelCache(**cfg.kwargs())
 
-    print(f"Caching model '{model_id}' to S3 bucket '{bucket}' ...")
-    success = cache.cache_model_to_s3(model_id)
+    print(f"Caching model '{cfg.model_id}' to S3 bucket '{cfg.bucket}' ...")
+    success = cache.cache_model_to_s3(cfg.model_id)
     if not success:
         print("ERROR: caching model to S3 failed", file=sys.stderr)
         return 1
@@ -62,4 +39,4 @@ def main() -> int:
 
 
 if __name__ == "__main__":
-    sys.exit(main())
\ No newline at end of file
+    sys.exit(main())
@@ -7,8 +7,24 @@ Schnelle Überprüfung der häufigsten 403-Fehler Ursachen.
 
 import os
 import re
+import sys
+from urllib.parse import urlparse
 from dotenv import load_dotenv
 
+# Precompiled at module scope so repeated invocations (e.g. from tests or
+# other scripts importing this module) skip the re-compile lookup.
+_RE_ALNUM = re.compile(r'^[A-Za-z0-9]+$')
+_RE_B64 = re.compile(r'^[A-Za-z0-9+/]+={0,2}$')
+_RE_HOST = re.compile(r'^[a-zA-Z0-9.-]+$')
+_RE_BUCKET = re.compile(r'^[a-z0-9.-]+$')
+# Fused alternation: one scan over the endpoint instead of four.
+_RE_HCP_ENDPOINT = re.compile(
+    r".*hcp-europe\.com"
+    r"|.*hcp\.com"
+    r"|.*hcp\.ash\.ash\.com"
+    r"|.*hcp\.us\.ash\.com"
+)
+
 
 def check_403_causes():
     """Überprüft häufigste 403-Ursachen."""
@@ -43,7 +59,7 @@ def check_403_causes():
     if access_key:
         if len(access_key) < 10:
             issues.append("❌ Access Key zu kurz (mindestens 10 Zeichen)")
-        elif not re.match(r'^[A-Za-z0-9]+$', access_key):
+        elif not _RE_ALNUM.match(access_key):
             issues.append("❌ Access Key enthält ungültige Zeichen")
         else:
             print("   ✅ Access Key Format ok")
@@ -51,7 +67,7 @@ def check_403_causes():
     if secret_key:
         if len(secret_key) < 20:
             issues.append("❌ Secret Key zu kurz (mindestens 20 Zeichen)")
-        elif not re.match(r'^[A-Za-z0-9+/]+={0,2}$', secret_key):
+        elif not _RE_B64.match(secret_key):
             issues.append("❌ Secret Key Format ungültig (sollte Base64 sein)")
         else:
             print("   ✅ Secret Key Format ok")
@@ -59,9 +75,12 @@ def check_403_causes():
     # Check 3: Endpoint format
     print("\n3️⃣ Prüfe Endpoint-Format...")
     if endpoint:
-        if not endpoint.startswith(("http://", "https://")):
+        # One urlparse pass replaces the startswith + regex double scan and
+        # also handles ports, credentials and IPv6 hosts correctly.
+        parsed = urlparse(endpoint)
+        if parsed.scheme not in ("http", "https"):
             issues.append("❌ Endpoint benötigt http:// oder https://")
-        elif not re.match(r'^https?://[a-zA-Z0-9.-]+', endpoint):
+        elif not (parsed.hostname and _RE_HOST.match(parsed.hostname)):
             issues.append("❌ Endpoint URL Format ungültig")
         else:
             print("   ✅ Endpoint Format ok")
@@ -71,7 +90,7 @@ def check_403_causes():
     if bucket:
         if len(bucket) < 3:
             issues.append("❌ Bucket/Namespace zu kurz (mindestens 3 Zeichen)")
-        elif not re.match(r'^[a-z0-9.-]+$', bucket.lower()):
+        elif not _RE_BUCKET.match(bucket.lower()):
             issues.append("❌ Bucket/Namespace darf nur Kleinbuchstaben, Zahlen, Punkte und Bindestriche enthalten")
         else:
             print("   ✅ Bucket/Namespace Format ok")
@@ -79,14 +98,7 @@ def check_403_causes():
     # Check 5: Common HCP endpoint patterns
     print("\n5️⃣ Prüfe HCP Endpoint Muster...")
     if endpoint:
-        hcp_patterns = [
-            r".*hcp-europe\.com",
-            r".*hcp\.com", 
-            r".*hcp\.ash\.ash\.com",
-            r".*hcp\.us\.ash\.com"
-        ]
-        
-        if any(re.search(pattern, endpoint) for pattern in hcp_patterns):
+        if _RE_HCP_ENDPOINT.search(endpoint):
             print("   ✅ Endpoint sieht wie HCP Endpoint aus")
         else:
             print("   ⚠️  Endpoint entspricht nicht typischen HCP Mustern")
@@ -7,11 +7,24 @@ Systematische Analyse von 403 Fehlern bei S3/HCP Verbindungen.
 
 import os
 import sys
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import boto3
 from botocore.exceptions import ClientError
 from dotenv import load_dotenv
 
+try:
+    # Reuse the package's memoized client factory when available so repeated
+    # invocations in one process skip botocore's loader and credential walk.
+    from s3modelcache._client import get_s3_client
+    from s3modelcache.config import load_config
+except ImportError:
+    get_s3_client = None
+    load_config = None
+
+# Fixed payload for the write-permission probe; built once at import.
+_TEST_BODY = b"permission-check"
+
 
 def analyze_403_error():
     """Detaillierte Analyse von 403 Fehlern."""
@@ -22,13 +35,21 @@ def analyze_403_error():
     # Load environment
     load_dotenv()
     
-    # Get configuration
-    endpoint = os.getenv("HCP_ENDPOINT") or os.getenv("S3_ENDPOINT")
-    access_key = os.getenv("HCP_ACCESS_KEY") or os.getenv("S3_ACCESS_KEY_ID")
-    secret_key = os.getenv("HCP_SECRET_KEY") or os.getenv("S3_SECRET_ACCESS_KEY")
-    bucket = os.getenv("HCP_NAMESPACE") or os.getenv("S3_BUCKET")
-    verify_ssl = os.getenv("VERIFY_SSL", "true").lower() == "true"
-    root_ca_path = os.getenv("ROOT_CA_PATH")
+    # Get configuration (one cached parse when the package is importable)
+    if load_config is not None:
+        cfg = load_config()
+        endpoint, access_key, secret_key, bucket = (
+            cfg.endpoint, cfg.access_key, cfg.secret_key, cfg.bucket,
+        )
+        verify_ssl = cfg.verify_ssl
+        root_ca_path = cfg.root_ca_path
+    else:
+        endpoint = os.getenv("HCP_ENDPOINT") or os.getenv("S3_ENDPOINT")
+        access_key = os.getenv("HCP_ACCESS_KEY") or os.getenv("S3_ACCESS_KEY_ID")
+        secret_key = os.getenv("HCP_SECRET_KEY") or os.getenv("S3_SECRET_ACCESS_KEY")
+        bucket = os.getenv("HCP_NAMESPACE") or os.getenv("S3_BUCKET")
+        verify_ssl = os.getenv("VERIFY_SSL", "true").lower() == "true"
+        root_ca_path = os.getenv("ROOT_CA_PATH")
     
     print("📋 Konfigurations-Check:")
     print(f"   Endpoint: {'✅' if endpoint else '❌'} {endpoint or 'Nicht gesetzt'}")
@@ -50,98 +71,129 @@ def analyze_403_error():
     if root_ca_path and verify_ssl:
         verify_config = root_ca_path
     
-    # Test 1: Basic connectivity without bucket operations
-    print("\n1️⃣ Test: Grundlegende Verbindung (ohne Bucket)")
     try:
-        s3 = boto3.client(
-            's3',
-            endpoint_url=endpoint,
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            region_name='us-east-1',
-            verify=verify_config
-        )
-        
-        # Try to list buckets (this tests authentication)
-        response = s3.list_buckets()
-        print(f"✅ Authentifizierung erfolgreich")
-        print(f"   Gefundene Buckets: {[b['Name'] for b in response.get('Buckets', [])]}")
-        
-    except ClientError as e:
-        error_code = e.response['Error']['Code']
-        if error_code == 'InvalidAccessKeyId':
-            print("❌ Ungültiger Access Key ID")
-            print("   → Prüfen Sie HCP_ACCESS_KEY / S3_ACCESS_KEY_ID")
-        elif error_code == 'SignatureDoesNotMatch':
-            print("❌ Ungültiger Secret Key")
-            print("   → Prüfen Sie HCP_SECRET_KEY / S3_SECRET_ACCESS_KEY")
-        elif error_code == '403':
-            print("❌ 403 Fehler beim List Buckets")
-            print("   → Mögliche Ursachen:")
-            print("     • Access/Secret Key falsch")
-            print("     • IP-Adresse nicht erlaubt")
-            print("     • Service Account fehlt Berechtigungen")
+        if get_s3_client is not None:
+            s3 = get_s3_client(endpoint, access_key, secret_key, verify=verify_config)
         else:
-            print(f"❌ Authentifizierungsfehler: {error_code} - {e}")
-        return False
+            s3 = boto3.client(
+                's3',
+                endpoint_url=endpoint,
+                aws_access_key_id=access_key,
+                aws_secret_access_key=secret_key,
+                region_name='us-east-1',
+                verify=verify_config
+            )
     except Exception as e:
         print(f"❌ Verbindungsfehler: {e}")
         return False
-    
+
+    # Test 1: Basic connectivity without bucket operations
+    def probe_auth():
+        try:
+            response = s3.list_buckets()
+            return True, [
+                "✅ Authentifizierung erfolgreich",
+                f"   Gefundene Buckets: {[b['Name'] for b in response.get('Buckets', [])]}",
+            ]
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code == 'InvalidAccessKeyId':
+                return False, [
+                    "❌ Ungültiger Access Key ID",
+                    "   → Prüfen Sie HCP_ACCESS_KEY / S3_ACCESS_KEY_ID",
+                ]
+            if error_code == 'SignatureDoesNotMatch':
+                return False, [
+                    "❌ Ungültiger Secret Key",
+                    "   → Prüfen Sie HCP_SECRET_KEY / S3_SECRET_ACCESS_KEY",
+                ]
+            if error_code == '403':
+                return False, [
+                    "❌ 403 Fehler beim List Buckets",
+                    "   → Mögliche Ursachen:",
+                    "     • Access/Secret Key falsch",
+                    "     • IP-Adresse nicht erlaubt",
+                    "     • Service Account fehlt Berechtigungen",
+                ]
+            return False, [f"❌ Authentifizierungsfehler: {error_code} - {e}"]
+        except Exception as e:
+            return False, [f"❌ Verbindungsfehler: {e}"]
+
     # Test 2: Check if specific bucket exists
-    print(f"\n2️⃣ Test: Bucket '{bucket}' Zugriff")
-    try:
-        s3.head_bucket(Bucket=bucket)
-        print("✅ Bucket existiert und ist zugreifbar")
-        
-    except ClientError as e:
-        error_code = e.response['Error']['Code']
-        if error_code == 'NoSuchBucket':
-            print(f"❌ Bucket '{bucket}' existiert nicht")
-            print("   → Prüfen Sie HCP_NAMESPACE / S3_BUCKET")
-            print("   → Oder erstellen Sie den Bucket im HCP Portal")
-        elif error_code == '403':
-            print(f"❌ 403 Fehler beim Bucket-Zugriff")
-            print("   → Mögliche Ursachen:")
-            print("     • Bucket existiert aber Sie haben keine Berechtigung")
-            print("     • Falscher Namespace/Bucket Name")
-            print("     • Service Account hat keine Bucket-Berechtigungen")
-        else:
-            print(f"❌ Bucket-Fehler: {error_code} - {e}")
-        return False
-    
+    def probe_bucket():
+        try:
+            s3.head_bucket(Bucket=bucket)
+            return True, ["✅ Bucket existiert und ist zugreifbar"]
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code == 'NoSuchBucket':
+                return False, [
+                    f"❌ Bucket '{bucket}' existiert nicht",
+                    "   → Prüfen Sie HCP_NAMESPACE / S3_BUCKET",
+                    "   → Oder erstellen Sie den Bucket im HCP Portal",
+                ]
+            if error_code == '403':
+                return False, [
+                    "❌ 403 Fehler beim Bucket-Zugriff",
+                    "   → Mögliche Ursachen:",
+                    "     • Bucket existiert aber Sie haben keine Berechtigung",
+                    "     • Falscher Namespace/Bucket Name",
+                    "     • Service Account hat keine Bucket-Berechtigungen",
+                ]
+            return False, [f"❌ Bucket-Fehler: {error_code} - {e}"]
+
     # Test 3: Try to list objects (tests read permissions)
-    print(f"\n3️⃣ Test: Objekte auflisten (Read Berechtigung)")
-    try:
-        response = s3.list_objects_v2(Bucket=bucket, MaxKeys=1)
-        count = len(response.get('Contents', []))
-        print(f"✅ Read Berechtigung vorhanden ({count} Objekte gefunden)")
-        
-    except ClientError as e:
-        error_code = e.response['Error']['Code']
-        if error_code == '403':
-            print("❌ Keine Read Berechtigung für diesen Bucket")
-            print("   → Service Account benötigt 'Read' Berechtigung für den Bucket")
-        else:
-            print(f"❌ Read Fehler: {error_code} - {e}")
+    def probe_read():
+        try:
+            response = s3.list_objects_v2(Bucket=bucket, MaxKeys=1)
+            count = len(response.get('Contents', []))
+            return True, [f"✅ Read Berechtigung vorhanden ({count} Objekte gefunden)"]
+        except ClientError as e:
+            error_code = e.response['Error']['Code']
+            if error_code == '403':
+                return False, [
+                    "❌ Keine Read Berechtigung für diesen Bucket",
+                    "   → Service Account benötigt 'Read' Berechtigung für den Bucket",
+                ]
+            return False, [f"❌ Read Fehler: {error_code} - {e}"]
+
+    # The three read-only probes are independent; run them concurrently so
+    # total wall-clock is max(RTT) instead of the sum. Results are printed
+    # in the fixed test order regardless of completion order.
+    headers = [
+        "\n1️⃣ Test: Grundlegende Verbindung (ohne Bucket)",
+        f"\n2️⃣ Test: Bucket '{bucket}' Zugriff",
+        f"\n3️⃣ Test: Objekte auflisten (Read Berechtigung)",
+    ]
+    with ThreadPoolExecutor(max_workers=3) as pool:
+        futures = [pool.submit(p) for p in (probe_auth, probe_bucket, probe_read)]
+        results = [f.result() for f in futures]
+
+    all_ok = True
+    for header, (ok, lines) in zip(headers, results):
+        print(header)
+        for line in lines:
+            print(line)
+        all_ok = all_ok and ok
+    if not all_ok:
         return False
-    
+
     # Test 4: Try to upload a test file (tests write permissions)
     print(f"\n4️⃣ Test: Test-Datei hochladen (Write Berechtigung)")
     try:
         test_key = "permission-test.txt"
-        test_content = b"Permission test - " + str(os.getpid()).encode()
-        
+
         s3.put_object(
             Bucket=bucket,
             Key=test_key,
-            Body=test_content,
+            Body=_TEST_BODY,
             Metadata={'test': 'permission-check'}
         )
         print("✅ Write Berechtigung vorhanden")
-        
-        # Clean up
-        s3.delete_object(Bucket=bucket, Key=test_key)
+
+        # Clean up via the bulk API — stays one HTTP call even if future
+        # probes write to several keys.
+        s3.delete_objects(Bucket=bucket, Delete={"Objects": [{"Key": test_key}]})
         print("✅ Test-Datei aufgeräumt")
         
     except ClientError as e:
@@ -7,12 +7,30 @@ for use with SSL verification.
 """
 
 import os
+import socket
+import ssl
 import sys
-import subprocess
 from pathlib import Path
 from dotenv import load_dotenv
 
 
+def _peer_chain_pem(tls_socket):
+    """Return the peer's certificate chain as a list of PEM strings.
+
+    Uses the interpreter's chain accessor when available (public API from
+    Python 3.13, present as a private accessor since 3.10); otherwise falls
+    back to just the leaf certificate.
+    """
+    sslobj = getattr(tls_socket, "_sslobj", None)
+    get_chain = getattr(sslobj, "get_unverified_chain", None)
+    if get_chain is not None:
+        certs = get_chain() or []
+        # Certificate.public_bytes() yields PEM by default.
+        return [cert.public_bytes() for cert in certs]
+    der = tls_socket.getpeercert(binary_form=True)
+    return [ssl.DER_cert_to_PEM_cert(der)] if der else []
+
+
 def extract_ca_certificate():
     """Extract CA certificate from S3 endpoint."""
     
@@ -38,83 +56,56 @@ def extract_ca_certificate():
     print(f"🌐 Hostname: {hostname}")
     print(f"🔌 Port: {port}")
     
-    # Extract certificate using OpenSSL
+    # Extract the certificate chain with an in-process TLS handshake —
+    # no openssl fork/exec, no PEM text scraping.
     ca_file = "root-ca.pem"
-    
+
     try:
         print(f"\n🔍 Extracting certificate to {ca_file}...")
-        
-        cmd = [
-            "openssl", "s_client", 
-            "-showcerts", 
-            "-connect", f"{hostname}:{port}",
-            "-servername", hostname
-        ]
-        
-        # Run openssl command
-        result = subprocess.run(
-            cmd, 
-            input="", 
-            text=True, 
-            capture_output=True, 
-            timeout=30
-        )
-        
-        if result.returncode != 0:
-            print(f"❌ OpenSSL command failed: {result.stderr}")
-            return False
-        
-        # Extract certificates from output
-        cert_data = []
-        in_cert = False
-        current_cert = []
-        
-        for line in result.stdout.split('\n'):
-            if line.startswith('-----BEGIN CERTIFICATE-----'):
-                in_cert = True
-                current_cert = [line]
-            elif line.startswith('-----END CERTIFICATE-----'):
-                current_cert.append(line)
-                cert_data.append('\n'.join(current_cert))
-                in_cert = False
-            elif in_cert:
-                current_cert.append(line)
-        
+
+        ctx = ssl.create_default_context()
+        # We are bootstrapping trust for a self-signed endpoint, so the
+        # handshake has to succeed without verification.
+        ctx.check_hostname = False
+        ctx.verify_mode = ssl.CERT_NONE
+
+        with socket.create_connection((hostname, port), timeout=30) as sock:
+            with ctx.wrap_socket(sock, server_hostname=hostname) as tls:
+                cert_data = _peer_chain_pem(tls)
+                peer_info = tls.getpeercert()
+
         if not cert_data:
-            print("❌ No certificates found in output")
+            print("❌ No certificates received from server")
             return False
-        
+
         # Write all certificates to file (chain)
         with open(ca_file, 'w') as f:
             for cert in cert_data:
-                f.write(cert + '\n\n')
-        
+                f.write(cert.rstrip('\n') + '\n\n')
+
         print(f"✅ Extracted {len(cert_data)} certificate(s) to {ca_file}")
-        
-        # Show certificate info
-        print(f"\n📄 Certificate Information:")
-        try:
-            cert_info_cmd = ["openssl", "x509", "-in", ca_file, "-noout", "-subject", "-issuer", "-dates"]
-            cert_result = subprocess.run(cert_info_cmd, capture_output=True, text=True)
-            if cert_result.returncode == 0:
-                for line in cert_result.stdout.strip().split('\n'):
-                    print(f"   {line}")
-        except Exception as e:
-            print(f"   Could not parse certificate info: {e}")
-        
+
+        # Show certificate info (getpeercert returns nothing for unverified
+        # peers on some Python builds, hence the guard)
+        if peer_info:
+            print(f"\n📄 Certificate Information:")
+            subject = dict(x[0] for x in peer_info.get('subject', ()))
+            issuer = dict(x[0] for x in peer_info.get('issuer', ()))
+            print(f"   subject: {subject}")
+            print(f"   issuer: {issuer}")
+            print(f"   notBefore: {peer_info.get('notBefore')}")
+            print(f"   notAfter: {peer_info.get('notAfter')}")
+
         print(f"\n💡 Usage:")
         print(f"   Add to your .env file:")
         print(f"   ROOT_CA_PATH={os.path.abspath(ca_file)}")
         print(f"   VERIFY_SSL=true")
-        
+
         return True
-        
-    except subprocess.TimeoutExpired:
+
+    except (socket.timeout, TimeoutError):
         print("❌ Connection timeout - endpoint may be unreachable")
         return False
-    except FileNotFoundError:
-        print("❌ OpenSSL not found - please install OpenSSL")
-        return False
     except Exception as e:
         print(f"❌ Error extracting certificate: {e}")
         return False
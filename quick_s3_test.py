@@ -11,6 +11,17 @@ from dotenv import load_dotenv
 import boto3
 from botocore.exceptions import ClientError
 
+try:
+    # Reuse the package's memoized client factory and config loader when
+    # available so repeated invocations in one process (e.g. from
+    # extract_ca.py --test) skip botocore's loader, the credential chain
+    # walk and the repeated getenv chains.
+    from s3modelcache._client import get_s3_client
+    from s3modelcache.config import load_config
+except ImportError:
+    get_s3_client = None
+    load_config = None
+
 
 def quick_s3_test():
     """Quick S3 connectivity test."""
@@ -21,13 +32,21 @@ def quick_s3_test():
     # Load environment
     load_dotenv()
     
-    # Get config
-    endpoint = os.getenv("HCP_ENDPOINT") or os.getenv("S3_ENDPOINT")
-    access_key = os.getenv("HCP_ACCESS_KEY") or os.getenv("S3_ACCESS_KEY_ID")
-    secret_key = os.getenv("HCP_SECRET_KEY") or os.getenv("S3_SECRET_ACCESS_KEY")
-    bucket = os.getenv("HCP_NAMESPACE") or os.getenv("S3_BUCKET")
-    verify_ssl = (os.getenv("HCP_VERIFY_SSL") or os.getenv("VERIFY_SSL", "true")).lower() == "true"
-    root_ca_path = os.getenv("HCP_ROOT_CA_PATH") or os.getenv("ROOT_CA_PATH")
+    # Get config (one cached parse when the package is importable)
+    if load_config is not None:
+        cfg = load_config()
+        endpoint, access_key, secret_key, bucket = (
+            cfg.endpoint, cfg.access_key, cfg.secret_key, cfg.bucket,
+        )
+        verify_ssl = cfg.verify_ssl
+        root_ca_path = cfg.root_ca_path
+    else:
+        endpoint = os.getenv("HCP_ENDPOINT") or os.getenv("S3_ENDPOINT")
+        access_key = os.getenv("HCP_ACCESS_KEY") or os.getenv("S3_ACCESS_KEY_ID")
+        secret_key = os.getenv("HCP_SECRET_KEY") or os.getenv("S3_SECRET_ACCESS_KEY")
+        bucket = os.getenv("HCP_NAMESPACE") or os.getenv("S3_BUCKET")
+        verify_ssl = (os.getenv("HCP_VERIFY_SSL") or os.getenv("VERIFY_SSL", "true")).lower() == "true"
+        root_ca_path = os.getenv("HCP_ROOT_CA_PATH") or os.getenv("ROOT_CA_PATH")
     
     if not all([endpoint, access_key, secret_key, bucket]):
         print("❌ Missing configuration in .env file")
@@ -41,15 +60,18 @@ def quick_s3_test():
         if root_ca_path and verify_ssl:
             verify_config = root_ca_path
         
-        # Create S3 client
-        s3 = boto3.client(
-            's3',
-            endpoint_url=endpoint,
-            aws_access_key_id=access_key,
-            aws_secret_access_key=secret_key,
-            region_name='us-east-1',
-            verify=verify_config
-        )
+        # Create S3 client (shared/memoized when the package is importable)
+        if get_s3_client is not None:
+            s3 = get_s3_client(endpoint, access_key, secret_key, verify=verify_config)
+        else:
+            s3 = boto3.client(
+                's3',
+                endpoint_url=endpoint,
+                aws_access_key_id=access_key,
+                aws_secret_access_key=secret_key,
+                region_name='us-east-1',
+                verify=verify_config
+            )
         
         # Test bucket access
         s3.head_bucket(Bucket=bucket)
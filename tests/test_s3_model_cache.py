@@ -1,3 +1,4 @@
+import hashlib
 import tempfile
 import tarfile
 import os
@@ -7,14 +8,33 @@ from unittest import mock
 import pytest
 
 from s3modelcache import S3ModelCache
+from s3modelcache import _client, model_cache
+
+
+def _sha256_of(path):
+    # hashlib.file_digest needs 3.11; the package still supports 3.10.
+    digest = hashlib.sha256()
+    with open(path, "rb") as fobj:
+        while chunk := fobj.read(1 << 20):
+            digest.update(chunk)
+    return digest.digest()
+
+
+@pytest.fixture(scope="module")
+def _mocked_boto():
+    """Patch boto3's client constructor once per module instead of per test."""
+    with mock.patch("boto3.Session.client") as mocked_client:
+        yield mocked_client
 
 
 @pytest.fixture
-def cache(tmp_path):
+def cache(tmp_path, _mocked_boto):
     """Return a S3ModelCache instance with a temporary local cache dir and mocked s3 client."""
-    with mock.patch("boto3.Session.client") as mocked_client:
-        mocked_client.return_value = mock.MagicMock()
-        c = S3ModelCache(
+    # The client factory memoizes per connection config; clear it so every
+    # test gets its own MagicMock client (call assertions stay isolated).
+    _client.get_s3_client.cache_clear()
+    _mocked_boto.return_value = mock.MagicMock()
+    return S3ModelCache(
         bucket_name="unit-test-bucket",
         s3_endpoint="https://dummy-endpoint",
         aws_access_key_id="key",
@@ -22,7 +42,6 @@ def cache(tmp_path):
         local_cache_dir=str(tmp_path),
         verify_ssl=False,
     )
-        return c
 
 
 def test_key_and_path_generation(cache):
@@ -37,12 +56,45 @@ def test_key_and_path_generation(cache):
     assert cache._get_local_path(model_id) == expected_path
 
 
+def test_hashed_key_style(tmp_path):
+    _client.get_s3_client.cache_clear()
+    with mock.patch("boto3.Session.client") as mocked_client:
+        mocked_client.return_value = mock.MagicMock()
+        cache = S3ModelCache(
+            bucket_name="bucket",
+            s3_endpoint="https://ep",
+            aws_access_key_id="k",
+            aws_secret_access_key="s",
+            local_cache_dir=str(tmp_path),
+            key_style="hash",
+        )
+    model_id = "huggingface/bert-base-uncased"
+    digest = hashlib.sha256(model_id.encode()).hexdigest()[:16]
+    assert cache._get_s3_key(model_id) == f"models/{digest}.tar.gz"
+    # Deterministic: same id, same key.
+    assert cache._get_s3_key(model_id) == cache._get_s3_key(model_id)
+
+
 def test_compress_and_extract_roundtrip(cache):
-    # Create dummy model directory with a file
+    # Create dummy model directory with a file. posix_fallocate reserves the
+    # bytes without building the payload in Python memory, so the same
+    # pattern scales to GB-sized stress fixtures.
     model_dir = cache._get_local_path("dummy/model")
     model_dir.mkdir(parents=True)
     file_path = model_dir / "weights.bin"
-    file_path.write_bytes(b"\x00" * 128)
+    fd = os.open(file_path, os.O_WRONLY | os.O_CREAT)
+    try:
+        if hasattr(os, "posix_fallocate"):
+            os.posix_fallocate(fd, 0, 128)
+        else:
+            os.ftruncate(fd, 128)
+    finally:
+        os.close(fd)
+
+    # A deep subtree checks that extraction recreates nested directories.
+    nested = model_dir / "tokenizer" / "vocab" / "extra"
+    nested.mkdir(parents=True)
+    (nested / "merges.txt").write_text("a b")
 
     archive_path = cache.local_cache_dir / "archive.tar.gz"
 
@@ -57,7 +109,42 @@ def test_compress_and_extract_roundtrip(cache):
 
     extracted_file = extract_dir.parent / model_dir.name / "weights.bin"
     assert extracted_file.exists()
-    assert extracted_file.read_bytes() == b"\x00" * 128
+    assert (
+        extract_dir.parent / model_dir.name / "tokenizer" / "vocab" / "extra" / "merges.txt"
+    ).read_text() == "a b"
+    # Chunked digest comparison instead of loading both files into memory.
+    assert _sha256_of(file_path) == _sha256_of(extracted_file)
+
+
+@pytest.mark.parametrize("fmt", ["tar", "tar.gz", "tar.zst"])
+def test_roundtrip_archive_formats(tmp_path, fmt):
+    if fmt == "tar.zst" and model_cache.zstandard is None:
+        pytest.skip("zstandard not installed")
+    _client.get_s3_client.cache_clear()
+    with mock.patch("boto3.Session.client") as mocked_client:
+        mocked_client.return_value = mock.MagicMock()
+        cache = S3ModelCache(
+            bucket_name="unit-test-bucket",
+            s3_endpoint="https://dummy-endpoint",
+            aws_access_key_id="key",
+            aws_secret_access_key="secret",
+            local_cache_dir=str(tmp_path),
+            archive_format=fmt,
+        )
+
+    model_dir = cache._get_local_path("fmt/model")
+    model_dir.mkdir(parents=True)
+    (model_dir / "weights.bin").write_bytes(b"\x07" * 512)
+
+    archive_path = cache.local_cache_dir / f"archive{cache._archive_suffix}"
+    cache._compress_model(model_dir, archive_path)
+    assert archive_path.exists()
+
+    extract_dir = cache.local_cache_dir / "extracted"
+    extract_dir.mkdir()
+    cache._extract_model(archive_path, extract_dir)
+    extracted = extract_dir.parent / model_dir.name / "weights.bin"
+    assert extracted.read_bytes() == b"\x07" * 512
 
 
 def test_upload_download_calls(cache):
@@ -72,13 +159,29 @@ def test_upload_download_calls(cache):
     with mock.patch.object(cache, "_compress_model", return_value=None), \
          mock.patch.object(cache, "_get_local_path", return_value=model_dir):
 
-        # Call upload; should trigger s3_client.upload_file
+        # Small archive → single put_object, no multipart machinery
         cache._upload_to_s3(dummy_tar, "some/key")
+        cache.s3_client.put_object.assert_called_once()
+        cache.s3_client.upload_file.assert_not_called()
+
+        # Above the single-PUT cutoff → multipart upload_file path with the
+        # tuned TransferConfig forwarded
+        with mock.patch.object(model_cache, "_SINGLE_PUT_MAX", 0):
+            cache._upload_to_s3(dummy_tar, "some/key")
         cache.s3_client.upload_file.assert_called_once()
+        assert (
+            cache.s3_client.upload_file.call_args.kwargs["Config"]
+            is cache._transfer_config
+        )
 
-        # Call download; should trigger s3_client.download_file
+        # Call download; should trigger s3_client.download_file with the
+        # download-side TransferConfig
         cache._download_from_s3("some/key", dummy_tar)
         cache.s3_client.download_file.assert_called_once()
+        assert (
+            cache.s3_client.download_file.call_args.kwargs["Config"]
+            is cache._download_transfer_config
+        )
 
 
 # ---------------------------------------------------------------------------
@@ -104,6 +207,10 @@ def test_list_cached_models_s3(cache):
 
     listed = set(cache.list_cached_models("s3"))
     assert listed == {"a_model", "b_model"}
+    # Shallow, page-sized listing: the grouping happens server-side.
+    _, kwargs = paginator.paginate.call_args
+    assert kwargs["Delimiter"] == "/"
+    assert kwargs["PaginationConfig"] == {"PageSize": 1000}
 
 
 def test_delete_cached_model_local(cache):
@@ -122,7 +229,178 @@ def test_delete_cached_model_s3(cache):
 
     success = cache.delete_cached_model(model_id, local=False, s3=True)
     assert success is True
-    cache.s3_client.delete_object.assert_called_once()
+    # One call for the archive, one each for its sidecar objects.
+    key = cache._get_s3_key(model_id)
+    deleted = [c.kwargs["Key"] for c in cache.s3_client.delete_object.call_args_list]
+    assert deleted == [key, key + ".sha256", key + ".manifest"]
+
+
+def test_delete_removes_mirror_copy(cache):
+    cache.s3_client.delete_object.reset_mock()
+    cache.mirror_prefix = "mirror/"
+    model_id = "delete/mirrored"
+
+    assert cache.delete_cached_model(model_id, local=False, s3=True)
+    key = cache._get_s3_key(model_id)
+    deleted = [c.kwargs["Key"] for c in cache.s3_client.delete_object.call_args_list]
+    # The replica must go too, or the existence probe's mirror fallback
+    # would keep reporting the model as present.
+    assert cache._mirror_key(key) in deleted
+
+
+def test_download_skips_when_head_matches(cache):
+    local = cache.local_cache_dir / "existing.tar.gz"
+    local.write_bytes(b"x" * 64)
+    cache.s3_client.head_object.return_value = {"ContentLength": 64}
+
+    assert cache._download_from_s3("some/key", local)
+    cache.s3_client.download_file.assert_not_called()
+
+
+def test_rolling_prefetch_reader(cache):
+    payload = bytes(range(256)) * 10
+
+    def fake_get_object(Bucket, Key, Range):
+        start, end = map(int, Range.split("=")[1].split("-"))
+        chunk = payload[start : end + 1]
+        body = mock.MagicMock()
+        body.read.return_value = chunk
+        return {
+            "Body": body,
+            "ContentRange": f"bytes {start}-{start + len(chunk) - 1}/{len(payload)}",
+        }
+
+    cache.s3_client.get_object.side_effect = fake_get_object
+    with model_cache._RollingPrefetchReader(
+        cache.s3_client, "bucket", "key", block_size=100, max_workers=2
+    ) as reader:
+        assert reader.read() == payload
+
+
+def test_rolling_prefetch_reader_range_ignored(cache):
+    # Some stores answer a ranged GET with the full body and no
+    # ContentRange; the reader must not schedule further ranges on top.
+    payload = bytes(range(256)) * 10
+
+    def fake_get_object(Bucket, Key, Range):
+        body = mock.MagicMock()
+        body.read.return_value = payload
+        return {"Body": body, "ContentLength": len(payload)}
+
+    cache.s3_client.get_object.side_effect = fake_get_object
+    with model_cache._RollingPrefetchReader(
+        cache.s3_client, "bucket", "key", block_size=100, max_workers=2
+    ) as reader:
+        assert reader.read() == payload
+    cache.s3_client.get_object.assert_called_once()
+
+
+def test_stream_extract_from_s3(cache):
+    # Build a real in-memory tar.gz and serve it through a fake ranged GET.
+    model_dir = cache._get_local_path("stream/model")
+    model_dir.mkdir(parents=True)
+    (model_dir / "weights.bin").write_bytes(b"\x01" * 4096)
+    import io
+
+    buf = io.BytesIO()
+    with tarfile.open(fileobj=buf, mode="w:gz") as tar:
+        tar.add(model_dir, arcname=model_dir.name)
+    payload = buf.getvalue()
+
+    def fake_get_object(Bucket, Key, Range):
+        start, end = map(int, Range.split("=")[1].split("-"))
+        chunk = payload[start : end + 1]
+        body = mock.MagicMock()
+        body.read.return_value = chunk
+        return {
+            "Body": body,
+            "ContentRange": f"bytes {start}-{start + len(chunk) - 1}/{len(payload)}",
+        }
+
+    cache.s3_client.get_object.side_effect = fake_get_object
+    extract_dir = cache.local_cache_dir / "streamed"
+    extract_dir.mkdir()
+    # Force the in-process extractor so the test does not depend on pigz.
+    with mock.patch.object(model_cache.shutil, "which", return_value=None):
+        assert cache._stream_extract_from_s3("models/stream_model.tar.gz", extract_dir)
+
+    extracted = extract_dir.parent / model_dir.name / "weights.bin"
+    assert extracted.read_bytes() == b"\x01" * 4096
+
+
+def test_load_falls_back_to_disk_path(cache):
+    # A mid-stream extract failure retries through the archive-on-disk path.
+    model_id = "fb/model"
+    local_path = cache._get_local_path(model_id)
+    with mock.patch.object(
+        cache, "_stream_extract_from_s3", side_effect=RuntimeError("mid-stream")
+    ), mock.patch.object(
+        cache, "_download_from_s3", return_value=True
+    ) as download, mock.patch.object(cache, "_extract_model") as extract:
+        assert cache.load_model_from_s3(model_id) == local_path
+    download.assert_called_once()
+    extract.assert_called_once()
+
+
+def test_multipart_writer_aborts_on_failed_close(cache):
+    client = cache.s3_client
+    client.create_multipart_upload.return_value = {"UploadId": "uid"}
+    client.upload_part.side_effect = RuntimeError("part lost")
+
+    writer = model_cache._S3MultipartWriter(client, "bucket", "models/x.tar.gz")
+    writer.write(b"data")
+    with pytest.raises(RuntimeError):
+        writer.close()
+    client.abort_multipart_upload.assert_called_once_with(
+        Bucket="bucket", Key="models/x.tar.gz", UploadId="uid"
+    )
+    # The caller's cleanup abort() after the failed close must be a no-op.
+    writer.abort()
+    client.abort_multipart_upload.assert_called_once()
+
+
+def test_multipart_writer_surfaces_part_failure_on_write(cache):
+    from concurrent.futures import wait
+
+    client = cache.s3_client
+    client.create_multipart_upload.return_value = {"UploadId": "uid"}
+    client.upload_part.side_effect = RuntimeError("part lost")
+
+    writer = model_cache._S3MultipartWriter(client, "bucket", "k", part_size=4)
+    writer.write(b"1234")  # fills one part, which fails in the pool
+    wait(writer._futures)
+    # The next part submission must re-raise instead of queueing more data.
+    with pytest.raises(RuntimeError):
+        writer.write(b"abcd")
+    writer.abort()
+    client.abort_multipart_upload.assert_called_once()
+
+
+def test_cache_models_to_s3_batch(cache):
+    def fake_cache(model_id, force):
+        if model_id == "boom/model":
+            raise RuntimeError("transient")
+        return model_id != "bad/model"
+
+    with mock.patch.object(cache, "cache_model_to_s3", side_effect=fake_cache):
+        results = cache.cache_models_to_s3(["a/model", "bad/model", "boom/model"])
+    # A raising model is recorded as a failure, not allowed to kill the batch.
+    assert results == {"a/model": True, "bad/model": False, "boom/model": False}
+
+
+def test_bulk_delete_uses_delete_objects(cache):
+    model_ids = ["bulk/one", "bulk/two"]
+
+    assert cache.delete_cached_models(model_ids, local=False, s3=True)
+    cache.s3_client.delete_objects.assert_called_once()
+    _, kwargs = cache.s3_client.delete_objects.call_args
+    keys = [o["Key"] for o in kwargs["Delete"]["Objects"]]
+    assert len(keys) <= 1000
+    expected = []
+    for model_id in model_ids:
+        key = cache._get_s3_key(model_id)
+        expected.extend((key, key + ".sha256", key + ".manifest"))
+    assert keys == expected
 
 
 def test_root_ca_path(tmp_path):
@@ -143,6 +421,18 @@ def test_root_ca_path(tmp_path):
         assert kwargs["verify"] == ca_path
 
 
+def test_client_pool_configuration():
+    _client.get_s3_client.cache_clear()
+    with mock.patch("boto3.Session.client") as mocked_client:
+        mocked_client.return_value = mock.MagicMock()
+        _client.get_s3_client("https://ep", "k", "s")
+        _, kwargs = mocked_client.call_args
+    config = kwargs["config"]
+    assert config.max_pool_connections == 64
+    assert config.tcp_keepalive is True
+    assert config.retries == {"mode": "adaptive", "max_attempts": 10}
+
+
 def test_memory_efficient_compression_with_large_files(cache):
     """Test memory-efficient compression with synthetic large files.
     